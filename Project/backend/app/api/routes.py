@@ -1,153 +1,251 @@
 """API routes for course recommendations."""
 
-from fastapi import APIRouter, HTTPException, UploadFile, File
-from typing import List, Optional
-from pydantic import BaseModel, field_validator
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import os
+import re
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, HTTPException, UploadFile, File, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import Annotated, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic_core import PydanticCustomError
 import sys
 from pathlib import Path
 
-# Add the pdf_to_dars directory to the path
-pdf_to_dars_path = Path(__file__).parent.parent.parent.parent / "pdf_to_dars"
-sys.path.insert(0, str(pdf_to_dars_path))
-
-from ..services.data_loader import get_data_loader
-from ..services.recommender import get_recommender
-from ..services.club_recommender import get_club_recommender
-from ..services.gened_recommender import get_gened_recommender
-from ..services.technical_recommender import get_technical_recommender
 from ..models.course import RecommendationResponse, Course
 from ..utils.validation import validate_course_codes
+from ..services.data_loader import DataLoader, get_data_loader
+from ..services.recommender import Recommender, get_recommender
+from ..services.club_recommender import ClubRecommender, get_club_recommender
+from ..services.gened_recommender import GenedRecommender, get_gened_recommender
+from ..services.technical_recommender import TechnicalRecommender, get_technical_recommender
+
+logger = logging.getLogger(__name__)
+
+# The pdf_to_dars package lives at the Project root, next to backend/
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _load_pdf_to_dars():
+    """Import the pdf_to_dars package from PROJECT_ROOT without touching sys.path."""
+    module = sys.modules.get("pdf_to_dars")
+    if module is not None:
+        return module
+    package_dir = PROJECT_ROOT / "pdf_to_dars"
+    init_file = package_dir / "__init__.py"
+    if not init_file.exists():
+        raise ImportError(f"DARS parser package not found at {package_dir}")
+    spec = importlib.util.spec_from_file_location(
+        "pdf_to_dars", init_file, submodule_search_locations=[str(package_dir)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    # Registered before exec so the package's relative imports resolve, and so
+    # later imports reuse this module instead of loading it again
+    sys.modules["pdf_to_dars"] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules["pdf_to_dars"]
+        raise
+    return module
+
 
 # Import DARS parser
 try:
-    # Add project root to path
-    project_root = Path(__file__).parent.parent.parent.parent
-    pdf_to_dars_file = project_root / "pdf_to_dars" / "pdf_to_dars.py"
-
-    if pdf_to_dars_file.exists():
-        import importlib.util
-
-        spec = importlib.util.spec_from_file_location("pdf_to_dars", pdf_to_dars_file)
-        pdf_to_dars_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(pdf_to_dars_module)
-        parse_courses = pdf_to_dars_module.parse_courses
-    else:
-        raise ImportError(f"DARS parser file not found at {pdf_to_dars_file}")
-except Exception as e:
+    parse_courses_stream = _load_pdf_to_dars().parse_courses_stream
+except ImportError as e:
     # Fallback if import fails
-    import logging
-
-    logger = logging.getLogger(__name__)
     logger.error(f"Could not import DARS parser: {e}")
+    # `e` is unbound once the except block exits, so keep the message
+    _dars_import_error = str(e)
 
-    def parse_courses(pdf_path: str) -> List[str]:
+    def parse_courses_stream(fp) -> List[str]:
         raise HTTPException(
-            status_code=500, detail=f"DARS parsing not available: {str(e)}"
+            status_code=500,
+            detail=f"DARS parsing not available: {_dars_import_error}",
         )
 
 
 router = APIRouter()
 
+# Service singletons, bound once at startup by bind_services(). Handlers fall
+# back to the get_* accessors if a route is hit before startup has run.
+_data_loader: Optional[DataLoader] = None
+_recommender: Optional[Recommender] = None
+_club_recommender: Optional[ClubRecommender] = None
+_gened_recommender: Optional[GenedRecommender] = None
+_technical_recommender: Optional[TechnicalRecommender] = None
+
+
+def bind_services() -> None:
+    """Bind the service singletons to module globals for the request handlers."""
+    global _data_loader, _recommender, _club_recommender
+    global _gened_recommender, _technical_recommender
+    _data_loader = get_data_loader()
+    _recommender = get_recommender()
+    _club_recommender = get_club_recommender()
+    _gened_recommender = get_gened_recommender()
+    _technical_recommender = get_technical_recommender()
+    # Render the /majors body now so the first caller doesn't pay for it
+    _majors_payload()
+
+
+# Dedicated pool for the /recommend/combined fan-out. It caps concurrent
+# recommender work at the CPU count and keeps CPU-bound calls off the default
+# threadpool that the sync endpoints run on.
+_RECOMMENDER_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="recommender"
+)
+
+
+# Catalog data only changes when the dataset is redeployed, so let browsers
+# and proxies reuse catalog responses instead of re-requesting them
+CATALOG_CACHE_CONTROL = "public, max-age=3600"
+
+# Shape of every catalog key ("CS 124", "MATH 221"); lookups are
+# case-insensitive, so lowercase input is accepted too
+COURSE_CODE_RE = re.compile(r"^[A-Z]{2,4} \d{3}[A-Z]?$", re.IGNORECASE)
+
+# Numeric request limits, checked by pydantic-core without a Python validator
+NumRecommendations = Annotated[int, Field(ge=1, le=20)]
+TopK = Annotated[int, Field(ge=1, le=50)]
+MinGpa = Annotated[float, Field(ge=0, le=4.0)]
+
 
 class RecommendationRequest(BaseModel):
     """Request model for recommendations."""
 
     major_name: str
     completed_courses: List[str]
-    num_recommendations: int = 5
+    num_recommendations: NumRecommendations = 5
 
     @field_validator("completed_courses")
     @classmethod
     def validate_courses(cls, v):
         """Validate and normalize course codes."""
         if not v:
-            raise ValueError("At least one completed course is required")
+            raise PydanticCustomError(
+                "courses_required", "At least one completed course is required"
+            )
         validated = validate_course_codes(v)
         if not validated:
-            raise ValueError("Invalid course code format")
+            raise PydanticCustomError("course_code_format", "Invalid course code format")
         return validated
 
-    @field_validator("num_recommendations")
-    @classmethod
-    def validate_num_recommendations(cls, v):
-        """Validate number of recommendations."""
-        if v < 1 or v > 20:
-            raise ValueError("num_recommendations must be between 1 and 20")
-        return v
-
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "major_name": "Computer Science, BS",
                 "completed_courses": ["CS 124", "MATH 221"],
                 "num_recommendations": 5,
             }
-        }
+        },
+    )
 
 
-@router.get("/majors")
-async def get_majors():
-    """Get list of all available majors."""
-    data_loader = get_data_loader()
-    majors = data_loader.get_all_majors()
-    return {"majors": majors}
+def _json_fragment(value) -> orjson.Fragment:
+    """Serialize value now (e.g. in a worker thread) for embedding in a later ORJSONResponse."""
+    # Same options ORJSONResponse renders with
+    return orjson.Fragment(
+        orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    )
 
 
-@router.get("/majors/{major_name}/courses")
-async def get_major_courses(major_name: str):
-    """Get all courses for a specific major."""
-    recommender = get_recommender()
+def _with_etag(body: bytes) -> Tuple[bytes, str]:
+    """Pair a serialized catalog body with a strong ETag for it."""
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def _catalog_response(http_request: Request, payload: Tuple[bytes, str]) -> Response:
+    """Serve pre-serialized catalog JSON, answering 304 when the client's copy is current."""
+    body, etag = payload
+    headers = {"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if_none_match = http_request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match == "*":
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@lru_cache(maxsize=1)
+def _majors_payload() -> Tuple[bytes, str]:
+    """Serialized /majors body and ETag, built once per process."""
+    data_loader = _data_loader or get_data_loader()
+    return _with_etag(orjson.dumps({"majors": data_loader.get_all_majors()}))
+
+
+@lru_cache(maxsize=512)
+def _major_courses_payload(major_name: str) -> Tuple[bytes, str]:
+    """Serialized course lists and ETag for a major (unknown majors raise and aren't cached)."""
+    recommender = _recommender or get_recommender()
     courses = recommender.get_major_courses(major_name)
 
     if not courses["required"] and not courses["electives"]:
         raise HTTPException(status_code=404, detail=f"Major '{major_name}' not found")
 
-    return courses
+    return _with_etag(orjson.dumps(courses))
+
+
+@router.get("/majors")
+def get_majors(http_request: Request):
+    """Get list of all available majors."""
+    return _catalog_response(http_request, _majors_payload())
+
+
+@router.get("/majors/{major_name}/courses")
+def get_major_courses(major_name: str, http_request: Request):
+    """Get all courses for a specific major."""
+    return _catalog_response(http_request, _major_courses_payload(major_name))
 
 
 @router.post("/recommend", response_model=RecommendationResponse)
-async def get_recommendations(request: RecommendationRequest):
+def get_recommendations(request: RecommendationRequest):
     """Get course recommendations for a student.
 
     Validates input and returns personalized course recommendations based on
     completed courses and major requirements.
     """
-    recommender = get_recommender()
-
-    try:
-        # Validate major exists
-        from ..services.data_loader import get_data_loader
+    recommender = _recommender or get_recommender()
+    data_loader = _data_loader or get_data_loader()
 
-        data_loader = get_data_loader()
-        major = data_loader.get_major(request.major_name)
-
-        if not major:
-            raise HTTPException(
-                status_code=404, detail=f"Major '{request.major_name}' not found"
-            )
+    # Validate major exists
+    if request.major_name not in data_loader.get_major_names():
+        raise HTTPException(
+            status_code=404, detail=f"Major '{request.major_name}' not found"
+        )
 
+    try:
         result = recommender.recommend_courses(
             major_name=request.major_name,
             completed_courses=request.completed_courses,
             num_recommendations=request.num_recommendations,
         )
-
-        return RecommendationResponse(**result)
-
-    except HTTPException:
-        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error generating recommendations: {str(e)}"
         )
 
+    # The recommender already returns the RecommendationResponse shape, so skip
+    # FastAPI's response_model re-validation; the model still documents the schema
+    return ORJSONResponse(result)
 
-@router.get("/courses/{course_code}")
-async def get_course_details(course_code: str):
-    """Get detailed information about a specific course."""
-    data_loader = get_data_loader()
+
+def _lookup_course(course_code: str) -> dict:
+    """Fetch a catalog course, rejecting malformed codes before the lookup."""
+    if not COURSE_CODE_RE.match(course_code):
+        raise HTTPException(
+            status_code=400, detail=f"Invalid course code format: '{course_code}'"
+        )
+
+    data_loader = _data_loader or get_data_loader()
     course = data_loader.get_course(course_code)
 
     if not course:
@@ -156,24 +254,31 @@ async def get_course_details(course_code: str):
     return course
 
 
+@router.get("/courses/{course_code}")
+def get_course_details(course_code: str):
+    """Get detailed information about a specific course."""
+    course = _lookup_course(course_code)
+
+    # Course records come straight from JSON, so orjson can render them without jsonable_encoder
+    return ORJSONResponse(course, headers={"Cache-Control": CATALOG_CACHE_CONTROL})
+
+
 @router.get("/courses/{course_code}/prerequisites")
-async def get_course_prerequisites(course_code: str):
+def get_course_prerequisites(course_code: str):
     """Get prerequisite chain for a course."""
-    data_loader = get_data_loader()
-    course = data_loader.get_course(course_code)
-
-    if not course:
-        raise HTTPException(status_code=404, detail=f"Course '{course_code}' not found")
+    course = _lookup_course(course_code)
 
     prerequisites = course.get("prerequisites", [])
 
-    return {
-        "course_code": course_code,
-        "prerequisites": prerequisites,
-        "can_take": len(prerequisites)
-        == 0,  # Simplified - would need completed courses to check
-        "missing": prerequisites,
-    }
+    return ORJSONResponse(
+        {
+            "course_code": course_code,
+            "prerequisites": prerequisites,
+            "can_take": not prerequisites,  # Simplified - would need completed courses to check
+            "missing": prerequisites,
+        },
+        headers={"Cache-Control": CATALOG_CACHE_CONTROL},
+    )
 
 
 class ClubRecommendationRequest(BaseModel):
@@ -182,41 +287,33 @@ class ClubRecommendationRequest(BaseModel):
     interests: str = ""
     preferred_tags: List[str] = []
     avoid_tags: List[str] = []
-    topk: int = 20
-
-    @field_validator("topk")
-    @classmethod
-    def validate_topk(cls, v):
-        """Validate number of recommendations."""
-        if v < 1 or v > 50:
-            raise ValueError("topk must be between 1 and 50")
-        return v
-
-    class Config:
-        """Pydantic config."""
+    topk: TopK = 20
 
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "interests": "sports fitness",
                 "preferred_tags": ["Athletic & Recreation"],
                 "avoid_tags": [],
                 "topk": 15,
             }
-        }
+        },
+    )
 
 
 @router.post("/clubs/recommend")
-async def get_club_recommendations(request: ClubRecommendationRequest):
+def get_club_recommendations(request: ClubRecommendationRequest):
     """Get club recommendations based on student interests."""
     try:
-        club_recommender = get_club_recommender()
+        club_recommender = _club_recommender or get_club_recommender()
         recommendations = club_recommender.recommend_clubs(
             interests=request.interests,
             preferred_tags=request.preferred_tags,
             avoid_tags=request.avoid_tags,
             topk=request.topk,
         )
-        return {"recommendations": recommendations}
+        return ORJSONResponse({"recommendations": recommendations})
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error generating club recommendations: {str(e)}"
@@ -228,30 +325,13 @@ class GenedRecommendationRequest(BaseModel):
 
     interests: str = ""
     gened_preferences: List[str] = []
-    min_gpa: float = 3.0
+    min_gpa: MinGpa = 3.0
     avoid_subjects: List[str] = []
-    topk: int = 20
-
-    @field_validator("topk")
-    @classmethod
-    def validate_topk(cls, v):
-        """Validate number of recommendations."""
-        if v < 1 or v > 50:
-            raise ValueError("topk must be between 1 and 50")
-        return v
-
-    @field_validator("min_gpa")
-    @classmethod
-    def validate_gpa(cls, v):
-        """Validate GPA threshold."""
-        if v < 0 or v > 4.0:
-            raise ValueError("min_gpa must be between 0 and 4.0")
-        return v
-
-    class Config:
-        """Pydantic config."""
+    topk: TopK = 20
 
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "interests": "psychology society culture",
                 "gened_preferences": ["HUM", "CS"],
@@ -259,14 +339,15 @@ class GenedRecommendationRequest(BaseModel):
                 "avoid_subjects": ["BTW"],
                 "topk": 20,
             }
-        }
+        },
+    )
 
 
 @router.post("/gened/recommend")
-async def get_gened_recommendations(request: GenedRecommendationRequest):
+def get_gened_recommendations(request: GenedRecommendationRequest):
     """Get GenEd course recommendations based on student interests."""
     try:
-        gened_recommender = get_gened_recommender()
+        gened_recommender = _gened_recommender or get_gened_recommender()
         recommendations = gened_recommender.recommend_courses(
             interests=request.interests,
             gened_preferences=request.gened_preferences,
@@ -274,7 +355,7 @@ async def get_gened_recommendations(request: GenedRecommendationRequest):
             avoid_subjects=request.avoid_subjects,
             topk=request.topk,
         )
-        return {"recommendations": recommendations}
+        return ORJSONResponse({"recommendations": recommendations})
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error generating GenEd recommendations: {str(e)}"
@@ -287,55 +368,37 @@ async def upload_dars(file: UploadFile = File(...)):
     if not file.filename or not file.filename.endswith(".pdf"):
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
-    import tempfile
-    import os
-    import traceback
-
-    tmp_path = None
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-            content = await file.read()
-            if not content:
-                raise HTTPException(status_code=400, detail="Uploaded file is empty")
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-
-        # Parse courses from PDF
+        # file.file is the fully received upload (Starlette's own spooled
+        # temp file), so it is measured and parsed in place rather than copied
+        upload = file.file
+        upload.seek(0, os.SEEK_END)
+        if not upload.tell():
+            raise HTTPException(status_code=400, detail="Uploaded file is empty")
+        upload.seek(0)
+
+        # Parse courses from PDF in a worker thread (CPU-bound)
         try:
-            courses = parse_courses(tmp_path)
+            courses = await asyncio.to_thread(parse_courses_stream, upload)
             if not isinstance(courses, list):
                 raise ValueError(
                     f"parse_courses returned unexpected type: {type(courses)}"
                 )
-            return {"courses": courses, "count": len(courses)}
+            return ORJSONResponse({"courses": courses, "count": len(courses)})
         except Exception as parse_error:
             error_msg = (
                 str(parse_error)
                 if str(parse_error)
                 else f"Unknown error: {type(parse_error).__name__}"
             )
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.error(f"DARS parsing error: {error_msg}\n{traceback.format_exc()}")
             raise HTTPException(
                 status_code=500, detail=f"Error parsing DARS PDF: {error_msg}"
             )
-        finally:
-            # Clean up temporary file
-            if tmp_path and os.path.exists(tmp_path):
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
     except HTTPException:
         raise
     except Exception as e:
         error_msg = str(e) if str(e) else f"Unknown error: {type(e).__name__}"
-        import logging
-
-        logger = logging.getLogger(__name__)
         logger.error(f"DARS upload error: {error_msg}\n{traceback.format_exc()}")
         raise HTTPException(
             status_code=500, detail=f"Error processing DARS PDF: {error_msg}"
@@ -351,31 +414,24 @@ class TechnicalRecommendationRequest(BaseModel):
     courses_in_progress: List[str] = []
     prefer_foundational: bool = False
     prefer_advanced: bool = False
-    topk: int = 20
+    topk: TopK = 20
 
     @field_validator("completed_courses")
     @classmethod
     def validate_courses(cls, v):
         """Validate and normalize course codes."""
         if not v:
-            raise ValueError("At least one completed course is required")
+            raise PydanticCustomError(
+                "courses_required", "At least one completed course is required"
+            )
         validated = validate_course_codes(v)
         if not validated:
-            raise ValueError("Invalid course code format")
+            raise PydanticCustomError("course_code_format", "Invalid course code format")
         return validated
 
-    @field_validator("topk")
-    @classmethod
-    def validate_topk(cls, v):
-        """Validate number of recommendations."""
-        if v < 1 or v > 50:
-            raise ValueError("topk must be between 1 and 50")
-        return v
-
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "major_name": "Computer Science, BS",
                 "completed_courses": ["CS 124", "MATH 221"],
@@ -385,14 +441,15 @@ class TechnicalRecommendationRequest(BaseModel):
                 "prefer_advanced": False,
                 "topk": 20,
             }
-        }
+        },
+    )
 
 
 @router.post("/technical/recommend")
-async def get_technical_recommendations(request: TechnicalRecommendationRequest):
+def get_technical_recommendations(request: TechnicalRecommendationRequest):
     """Get technical course recommendations based on major, completed courses, and interests."""
     try:
-        technical_recommender = get_technical_recommender()
+        technical_recommender = _technical_recommender or get_technical_recommender()
         recommendations = technical_recommender.recommend_courses(
             major_name=request.major_name,
             completed_courses=request.completed_courses,
@@ -402,7 +459,7 @@ async def get_technical_recommendations(request: TechnicalRecommendationRequest)
             prefer_advanced=request.prefer_advanced,
             topk=request.topk,
         )
-        return {"recommendations": recommendations}
+        return ORJSONResponse({"recommendations": recommendations})
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -421,40 +478,54 @@ class CombinedRecommendationRequest(BaseModel):
     technical_prefer_advanced: bool = False
     gened_interests: str = ""
     gened_preferences: List[str] = []
-    gened_min_gpa: float = 3.0
+    gened_min_gpa: MinGpa = 3.0
     gened_avoid_subjects: List[str] = []
     club_interests: str = ""
     club_preferred_tags: List[str] = []
     club_avoid_tags: List[str] = []
-    course_num_recommendations: int = 10
-    technical_topk: int = 20
-    gened_topk: int = 20
-    club_topk: int = 20
+    course_num_recommendations: NumRecommendations = 10
+    technical_topk: TopK = 20
+    gened_topk: TopK = 20
+    club_topk: TopK = 20
+
+    @field_validator("completed_courses")
+    @classmethod
+    def validate_courses(cls, v):
+        """Validate and normalize course codes."""
+        if not v:
+            raise PydanticCustomError(
+                "courses_required", "At least one completed course is required"
+            )
+        validated = validate_course_codes(v)
+        if not validated:
+            raise PydanticCustomError("course_code_format", "Invalid course code format")
+        return validated
+
+    model_config = ConfigDict(frozen=True)
 
 
 @router.post("/recommend/combined")
 async def get_combined_recommendations(request: CombinedRecommendationRequest):
     """Get combined recommendations for courses, GenEd, and clubs."""
-    import asyncio
-    import logging
-    import time
-    
-    logger = logging.getLogger(__name__)
+
     start_time = time.time()
-    logger.info(f"[COMBINED] Starting combined recommendations request for major: {request.major_name}")
-    logger.info(f"[COMBINED] Request params: completed_courses={len(request.completed_courses or [])}, "
-                f"technical_topk={request.technical_topk}, gened_topk={request.gened_topk}, club_topk={request.club_topk}")
-    
+    # Per-step logs are DEBUG with lazy %-formatting; one INFO line summarizes the request
+    logger.debug(
+        "[COMBINED] Starting for major=%s completed_courses=%d technical_topk=%d gened_topk=%d club_topk=%d",
+        request.major_name, len(request.completed_courses or []),
+        request.technical_topk, request.gened_topk, request.club_topk,
+    )
+
     try:
-        results = {}
-        
-        # Define functions to run in threads
+        # Result sizes for the summary log (the results themselves are pre-encoded)
+        counts = {}
+
+        # Define functions to run in threads. Each one serializes its own
+        # results, so JSON encoding happens in the workers, not on the event loop
         def get_gened():
             try:
-                logger.info("[COMBINED] [GenEd] Starting GenEd recommendations...")
                 gened_start = time.time()
-                gened_recommender = get_gened_recommender()
-                logger.info(f"[COMBINED] [GenEd] Recommender initialized in {time.time() - gened_start:.2f}s")
+                gened_recommender = _gened_recommender or get_gened_recommender()
                 recommendations = gened_recommender.recommend_courses(
                     interests=request.gened_interests,
                     gened_preferences=request.gened_preferences,
@@ -462,37 +533,35 @@ async def get_combined_recommendations(request: CombinedRecommendationRequest):
                     avoid_subjects=request.gened_avoid_subjects,
                     topk=request.gened_topk,
                 )
-                logger.info(f"[COMBINED] [GenEd] Completed in {time.time() - gened_start:.2f}s, got {len(recommendations)} recommendations")
-                return recommendations
+                logger.debug("[COMBINED] [GenEd] Completed in %.2fs, got %d recommendations", time.time() - gened_start, len(recommendations))
+                counts["gened"] = len(recommendations)
+                return _json_fragment(recommendations)
             except Exception as e:
-                logger.error(f"[COMBINED] [GenEd] Error: {str(e)}", exc_info=True)
+                logger.error("[COMBINED] [GenEd] Error: %s", e, exc_info=True)
                 return []
 
         def get_clubs():
             try:
-                logger.info("[COMBINED] [Clubs] Starting club recommendations...")
                 club_start = time.time()
-                club_recommender = get_club_recommender()
-                logger.info(f"[COMBINED] [Clubs] Recommender initialized in {time.time() - club_start:.2f}s")
+                club_recommender = _club_recommender or get_club_recommender()
                 recommendations = club_recommender.recommend_clubs(
                     interests=request.club_interests,
                     preferred_tags=request.club_preferred_tags,
                     avoid_tags=request.club_avoid_tags,
                     topk=request.club_topk,
                 )
-                logger.info(f"[COMBINED] [Clubs] Completed in {time.time() - club_start:.2f}s, got {len(recommendations)} recommendations")
-                return recommendations
+                logger.debug("[COMBINED] [Clubs] Completed in %.2fs, got %d recommendations", time.time() - club_start, len(recommendations))
+                counts["clubs"] = len(recommendations)
+                return _json_fragment(recommendations)
             except Exception as e:
-                logger.error(f"[COMBINED] [Clubs] Error: {str(e)}", exc_info=True)
+                logger.error("[COMBINED] [Clubs] Error: %s", e, exc_info=True)
                 return []
 
         def get_technical():
             """Get technical course recommendations."""
             try:
-                logger.info(f"[COMBINED] [Technical] Starting technical recommendations for major: {request.major_name}")
                 tech_start = time.time()
-                technical_recommender = get_technical_recommender()
-                logger.info(f"[COMBINED] [Technical] Recommender initialized in {time.time() - tech_start:.2f}s")
+                technical_recommender = _technical_recommender or get_technical_recommender()
                 recommendations = technical_recommender.recommend_courses(
                     major_name=request.major_name,
                     completed_courses=request.completed_courses,
@@ -501,94 +570,96 @@ async def get_combined_recommendations(request: CombinedRecommendationRequest):
                     prefer_advanced=request.technical_prefer_advanced,
                     topk=request.technical_topk,
                 )
-                logger.info(f"[COMBINED] [Technical] Completed in {time.time() - tech_start:.2f}s, got {len(recommendations)} recommendations")
-                return {"technical_courses": recommendations}
+                logger.debug("[COMBINED] [Technical] Completed in %.2fs, got %d recommendations", time.time() - tech_start, len(recommendations))
+                counts["technical_courses"] = len(recommendations)
+                return {"technical_courses": _json_fragment(recommendations)}
             except Exception as e:
-                logger.warning(f"[COMBINED] [Technical] Technical recommender failed: {str(e)}, falling back to old recommender", exc_info=True)
+                logger.warning("[COMBINED] [Technical] Technical recommender failed: %s, falling back to old recommender", e, exc_info=True)
                 # Fallback to old recommender if technical fails
                 try:
-                    logger.info("[COMBINED] [Technical] Attempting fallback to old recommender...")
                     fallback_start = time.time()
-                    recommender = get_recommender()
-                    data_loader = get_data_loader()
-                    major = data_loader.get_major(request.major_name)
+                    recommender = _recommender or get_recommender()
+                    data_loader = _data_loader or get_data_loader()
 
-                    if major:
+                    if request.major_name in data_loader.get_major_names():
                         course_result = recommender.recommend_courses(
                             major_name=request.major_name,
                             completed_courses=request.completed_courses,
                             num_recommendations=request.course_num_recommendations,
                         )
-                        logger.info(f"[COMBINED] [Technical] Fallback completed in {time.time() - fallback_start:.2f}s")
+                        logger.debug("[COMBINED] [Technical] Fallback completed in %.2fs", time.time() - fallback_start)
+                        courses = course_result.get("recommendations", [])
+                        counts["courses"] = len(courses)
                         return {
-                            "courses": course_result.get("recommendations", []),
-                            "progress": course_result.get("progress", {}),
-                            "semester_plan": course_result.get("semester_plan"),
+                            "courses": _json_fragment(courses),
+                            "progress": _json_fragment(course_result.get("progress", {})),
+                            "semester_plan": _json_fragment(course_result.get("semester_plan")),
                             "student_year": course_result.get("student_year")
                         }
                     else:
-                        logger.warning(f"[COMBINED] [Technical] Major {request.major_name} not found in data loader")
+                        logger.warning("[COMBINED] [Technical] Major %s not found in data loader", request.major_name)
                         return {"courses": []}
                 except Exception as fallback_error:
-                    logger.error(f"[COMBINED] [Technical] Fallback recommender also failed: {str(fallback_error)}", exc_info=True)
+                    logger.error("[COMBINED] [Technical] Fallback recommender also failed: %s", fallback_error, exc_info=True)
                     return {"courses": []}
 
         # Run all recommendations in parallel
-        logger.info("[COMBINED] Starting all recommendation tasks in parallel...")
-        tasks = []
-        
-        # Always run GenEd and Clubs
-        tasks.append(asyncio.to_thread(get_gened))
-        tasks.append(asyncio.to_thread(get_clubs))
-        
+        loop = asyncio.get_running_loop()
+        tasks = {}
+
+        # Only run the sections the caller asked for. GenEd needs interests,
+        # preferred categories or subjects to avoid
+        if request.gened_interests.strip() or request.gened_preferences or request.gened_avoid_subjects:
+            tasks["gened"] = loop.run_in_executor(_RECOMMENDER_POOL, get_gened)
+
+        # Clubs are ranked purely on interests and tags; with none of them
+        # every score is zero and the result is arbitrary, so skip the work
+        if request.club_interests.strip() or request.club_preferred_tags or request.club_avoid_tags:
+            tasks["clubs"] = loop.run_in_executor(_RECOMMENDER_POOL, get_clubs)
+
         # Run technical if major is provided
         if request.major_name:
-            tasks.append(asyncio.to_thread(get_technical))
-        
+            tasks["technical"] = loop.run_in_executor(_RECOMMENDER_POOL, get_technical)
+
         # Wait for all tasks to complete
-        logger.info(f"[COMBINED] Waiting for {len(tasks)} tasks to complete...")
-        task_results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results
-        gened_idx = 0
-        club_idx = 1
-        tech_idx = 2 if request.major_name else None
-        
+        task_results = dict(
+            zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True))
+        )
+
         # Handle GenEd results
-        gened_recommendations = task_results[gened_idx]
+        gened_recommendations = task_results.get("gened", [])
         if isinstance(gened_recommendations, Exception):
-            logger.error(f"[COMBINED] GenEd recommendations failed: {str(gened_recommendations)}", exc_info=True)
-            results["gened"] = []
-        else:
-            results["gened"] = gened_recommendations
-        
+            logger.error("[COMBINED] GenEd recommendations failed: %s", gened_recommendations, exc_info=gened_recommendations)
+            gened_recommendations = []
+
         # Handle Club results
-        club_recommendations = task_results[club_idx]
+        club_recommendations = task_results.get("clubs", [])
         if isinstance(club_recommendations, Exception):
-            logger.error(f"[COMBINED] Club recommendations failed: {str(club_recommendations)}", exc_info=True)
-            results["clubs"] = []
-        else:
-            results["clubs"] = club_recommendations
-        
+            logger.error("[COMBINED] Club recommendations failed: %s", club_recommendations, exc_info=club_recommendations)
+            club_recommendations = []
+
+        results = {"gened": gened_recommendations, "clubs": club_recommendations}
+
         # Handle Technical results
-        if tech_idx is not None:
-            technical_result = task_results[tech_idx]
+        if "technical" in tasks:
+            technical_result = task_results["technical"]
             if isinstance(technical_result, Exception):
-                logger.error(f"[COMBINED] Technical recommendations failed: {str(technical_result)}", exc_info=True)
+                logger.error("[COMBINED] Technical recommendations failed: %s", technical_result, exc_info=technical_result)
                 results["technical_courses"] = []
                 results["courses"] = []
             else:
                 results.update(technical_result)
 
         total_time = time.time() - start_time
-        logger.info(f"[COMBINED] Combined recommendations completed successfully in {total_time:.2f}s")
-        logger.info(f"[COMBINED] Results: technical={len(results.get('technical_courses', []))}, "
-                   f"courses={len(results.get('courses', []))}, gened={len(results.get('gened', []))}, "
-                   f"clubs={len(results.get('clubs', []))}")
-        return results
+        logger.info(
+            "[COMBINED] Completed in %.2fs: technical=%d courses=%d gened=%d clubs=%d",
+            total_time, counts.get("technical_courses", 0), counts.get("courses", 0),
+            counts.get("gened", 0), counts.get("clubs", 0),
+        )
+        return ORJSONResponse(results)
     except Exception as e:
         total_time = time.time() - start_time
-        logger.error(f"[COMBINED] Error generating combined recommendations after {total_time:.2f}s: {str(e)}", exc_info=True)
+        logger.error("[COMBINED] Error generating combined recommendations after %.2fs: %s", total_time, e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Error generating combined recommendations: {str(e)}",
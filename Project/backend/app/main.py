@@ -1,8 +1,15 @@
 """FastAPI application entry point."""
+import asyncio
 import logging
-from fastapi import FastAPI
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from .api.routes import router
+from .api.routes import router, bind_services, _RECOMMENDER_POOL
+from .services.data_loader import get_data_loader
 from .services.recommender import get_recommender
 from .services.technical_recommender import get_technical_recommender
 from .services.gened_recommender import get_gened_recommender
@@ -13,34 +20,16 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+logger = logging.getLogger(__name__)
 
-app = FastAPI(
-    title="UIUC Course Recommendation API",
-    description="API for course recommendations based on completed courses and major requirements",
-    version="1.0.0"
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000", "http://127.0.0.1:5173"],  # Vite default ports
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Set once every warmup has succeeded; /health answers 503 until then so
+# deploy probes can gate traffic on it
+_ready = False
 
-# Include API routes
-app.include_router(router, prefix="/api", tags=["api"])
 
-
-@app.on_event("startup")
 async def _preload_singletons():
     """Preload heavy singletons (recommenders) on startup to avoid first-request delays."""
-    import logging
-    import asyncio
-    import time
-
-    logger = logging.getLogger(__name__)
+    global _ready
     logger.info("=" * 60)
     logger.info("STARTUP: Preloading recommender singletons and data...")
     logger.info("=" * 60)
@@ -53,37 +42,45 @@ async def _preload_singletons():
         def warmup_recommender():
             logger.info("[Startup] Initializing base recommender...")
             recommender = get_recommender()
+            # Build the cached majors list and name index used by /majors and /recommend
+            data_loader = get_data_loader()
+            data_loader.get_all_majors()
+            data_loader.get_major_names()
             logger.info("[Startup] Base recommender initialized")
-            return recommender
+            return True
         
         def warmup_technical():
             logger.info("[Startup] Initializing technical recommender...")
-            recommender = get_technical_recommender()
-            recommender.warmup()
-            return recommender
+            return get_technical_recommender().warmup()
         
         def warmup_gened():
             logger.info("[Startup] Initializing gened recommender...")
-            recommender = get_gened_recommender()
-            recommender.warmup()
-            return recommender
+            return get_gened_recommender().warmup()
         
         def warmup_club():
             logger.info("[Startup] Initializing club recommender...")
-            recommender = get_club_recommender()
-            recommender.warmup()
-            return recommender
+            return get_club_recommender().warmup()
         
-        # Run all warmups in parallel to speed up startup
+        warmups = (warmup_recommender, warmup_technical, warmup_gened, warmup_club)
+        
+        # Run all warmups in parallel to speed up startup. A dedicated pool gives
+        # each warmup its own thread instead of queueing behind the default
+        # executor, and is shut down afterwards so no idle threads linger.
         logger.info("[Startup] Running all warmups in parallel...")
-        await asyncio.gather(
-            loop.run_in_executor(None, warmup_recommender),
-            loop.run_in_executor(None, warmup_technical),
-            loop.run_in_executor(None, warmup_gened),
-            loop.run_in_executor(None, warmup_club),
-        )
+        pool = ThreadPoolExecutor(max_workers=len(warmups), thread_name_prefix="warmup")
+        try:
+            results = await asyncio.gather(*(loop.run_in_executor(pool, fn) for fn in warmups))
+        finally:
+            pool.shutdown(wait=False)
+        # Hand the warmed singletons to the request handlers
+        bind_services()
         
         total_time = time.time() - start_time
+        if not all(results):
+            failed = [fn.__name__ for fn, ok in zip(warmups, results) if not ok]
+            logger.error("STARTUP INCOMPLETE: %s failed after %.2fs; not ready", ", ".join(failed), total_time)
+            return
+        _ready = True
         logger.info("=" * 60)
         logger.info(f"STARTUP COMPLETE: All recommenders loaded in {total_time:.2f}s")
         logger.info("=" * 60)
@@ -91,18 +88,64 @@ async def _preload_singletons():
         logger.exception("Error preloading recommender singletons: %s", e)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the recommenders before serving requests."""
+    await _preload_singletons()
+    yield
+    # Don't let queued recommendation work hold up shutdown
+    _RECOMMENDER_POOL.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(
+    title="UIUC Course Recommendation API",
+    description="API for course recommendations based on completed courses and major requirements",
+    version="1.0.0",
+    # Recommendation payloads are large lists of dicts; orjson serializes them much faster
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Configure CORS. Methods and headers are pinned to what the frontend sends so
+# preflights are matched against a fixed list instead of echoing a wildcard.
+CORS_ALLOW_METHODS = ("GET", "POST", "OPTIONS")
+CORS_ALLOW_HEADERS = ("content-type", "authorization")
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["http://localhost:5173", "http://localhost:3000", "http://127.0.0.1:5173"],  # Vite default ports
+    allow_credentials=True,
+    allow_methods=CORS_ALLOW_METHODS,
+    allow_headers=CORS_ALLOW_HEADERS,
+)
+
+# Include API routes
+app.include_router(router, prefix="/api", tags=["api"])
+
+
+# Static bodies for the tiny GET endpoints, serialized once at import
+_ROOT_BYTES = orjson.dumps({
+    "message": "UIUC Course Recommendation API",
+    "version": "1.0.0",
+    "docs": "/docs"
+})
+_HEALTH_BYTES = {
+    ready: orjson.dumps({"status": "healthy" if ready else "unavailable", "ready": ready})
+    for ready in (False, True)
+}
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "message": "UIUC Course Recommendation API",
-        "version": "1.0.0",
-        "docs": "/docs"
-    }
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy"}
-
+    """Health check endpoint; 503 until every recommender has warmed up."""
+    return Response(
+        _HEALTH_BYTES[_ready],
+        status_code=200 if _ready else 503,
+        media_type="application/json",
+    )
@@ -1,5 +1,5 @@
 """Course data models."""
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict, Any
 
 
@@ -12,6 +12,8 @@ class Course(BaseModel):
     prerequisites: List[str] = []
     postrequisites: List[str] = []
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Recommendation(BaseModel):
     """Course recommendation model."""
@@ -24,6 +26,8 @@ class Recommendation(BaseModel):
     sequence_aligned: bool = False
     semester: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Progress(BaseModel):
     """Degree progress model."""
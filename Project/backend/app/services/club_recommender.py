@@ -2,11 +2,77 @@
 import pandas as pd
 import numpy as np
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from fuzzywuzzy import process
+from rapidfuzz import fuzz, process, utils as fuzz_utils
+
+from ..utils.disk_cache import load_or_build
+
+
+# Interest keywords -> club categories they imply. Matched as substrings of the
+# interest text, so e.g. "computers" still hits "computer" and "sports" hits
+# both "sport" and "sports".
+_TAG_RULES: Dict[str, Tuple[str, ...]] = {
+    'sports': ('Athletic & Recreation', 'Club Sports'),
+    'sport': ('Athletic & Recreation', 'Club Sports'),
+    'athletic': ('Athletic & Recreation', 'Club Sports'),
+    'fitness': ('Athletic & Recreation', 'Club Sports'),
+    'exercise': ('Athletic & Recreation', 'Club Sports'),
+    'gym': ('Athletic & Recreation', 'Club Sports'),
+    'business': ('Business',),
+    'professional': ('Business',),
+    'career': ('Business',),
+    'engineering': ('Engineering & Mathematics',),
+    'math': ('Engineering & Mathematics',),
+    'art': ('Media Arts', 'Performance Arts'),
+    'music': ('Performance Arts',),
+    'dance': ('Performance Arts',),
+    'theater': ('Performance Arts',),
+    'theatre': ('Performance Arts',),
+    'performance': ('Performance Arts',),
+    'creative': ('Media Arts', 'Performance Arts'),
+    'volunteer': ('Community Service & Philanthropy',),
+    'service': ('Community Service & Philanthropy',),
+    'community': ('Community Service & Philanthropy',),
+    'philanthropy': ('Community Service & Philanthropy',),
+    'social': ('Social & Leisure', 'Community Service & Philanthropy'),
+    'technology': ('Technology',),
+    'tech': ('Technology',),
+    'computer': ('Technology', 'Information & Data Sciences'),
+    'programming': ('Technology',),
+    'coding': ('Technology',),
+    'data': ('Information & Data Sciences',),
+    'science': ('Life & Physical Sciences', 'Social & Behavioral Sciences'),
+    'stem': ('Technology', 'Engineering & Mathematics', 'Life & Physical Sciences'),
+    'culture': ('Identity & Culture',),
+    'cultural': ('Identity & Culture',),
+    'identity': ('Identity & Culture',),
+    'international': ('International',),
+    'health': ('Health & Wellness', 'Health & Human Sciences'),
+    'medical': ('Health & Wellness',),
+    'medicine': ('Health & Wellness',),
+    'wellness': ('Health & Wellness',),
+    'activism': ('Advocacy & Activism',),
+    'advocacy': ('Advocacy & Activism',),
+    'justice': ('Advocacy & Activism',),
+    'education': ('Education', 'Pedagogy & Instruction'),
+    'teaching': ('Education', 'Pedagogy & Instruction'),
+    'faith': ('Faith', 'Religion & Spirituality'),
+    'religion': ('Religion & Spirituality',),
+    'spiritual': ('Religion & Spirituality',),
+    'greek': ('Social Fraternities & Sororities',),
+    'fraternity': ('Social Fraternities & Sororities',),
+    'sorority': ('Social Fraternities & Sororities',),
+    'environment': ('Environmental & Sustainability',),
+    'sustainability': ('Environmental & Sustainability',),
+    'politics': ('Ideology & Politics',),
+    'political': ('Ideology & Politics',),
+    'law': ('Law',),
+}
 
 
 class ClubRecommender:
@@ -33,10 +99,20 @@ class ClubRecommender:
         self._tag_categories: Optional[Dict] = None
         self._vectorizer: Optional[TfidfVectorizer] = None
         self._X_tfidf = None
-        self._vocab: Optional[Set[str]] = None
+        self._tag_index: Optional[Dict[str, int]] = None
+        self._tag_incidence = None
+        self._club_sims: Optional[np.ndarray] = None
+        self._transform_query = None
+        self._vocab: Optional[List[str]] = None
+        # Only a few dozen tag categories exist, so tag combinations repeat often
+        self._tag_adjustment = lru_cache(maxsize=256)(self._compute_tag_adjustment)
+        # ...and new combinations are mostly made of tags already scanned
+        self._tag_matches = lru_cache(maxsize=512)(self._compute_tag_matches)
+        # Whole results for repeated queries (refreshes, common tag picks)
+        self._recommend_cached = lru_cache(maxsize=1024)(self._compute_recommendations)
     
-    def warmup(self) -> None:
-        """Pre-load all data to avoid first-request delays."""
+    def warmup(self) -> bool:
+        """Pre-load all data to avoid first-request delays; returns False if loading failed."""
         import logging
         import time
         logger = logging.getLogger(__name__)
@@ -47,19 +123,29 @@ class ClubRecommender:
         try:
             self._load_tag_categories()
             self._load_clubs()  # This also builds TF-IDF
+            # Run one tiny query so the scoring path is exercised before real traffic
+            self.recommend_clubs(interests="technology", topk=1)
             logger.info(f"[ClubRecommender] Warmup completed in {time.time() - start:.2f}s")
+            return True
         except Exception as e:
             logger.error(f"[ClubRecommender] Warmup failed: {e}", exc_info=True)
+            return False
     
     def _load_tag_categories(self) -> Dict[str, List[str]]:
         """Load tag categories from CSV."""
         if self._tag_categories is None:
             try:
-                tags_df = pd.read_csv(self.tags_path)
-                self._tag_categories = {}
-                for _, row in tags_df.iterrows():
-                    if 'tag' in row:
-                        self._tag_categories[row['tag']] = row
+                # Only the tag names are used; skip the large club-list column
+                tags_df = pd.read_csv(self.tags_path, usecols=lambda col: col == 'tag')
+                if 'tag' in tags_df.columns:
+                    # Later rows win on duplicate tags, as with the old row-by-row build
+                    self._tag_categories = (
+                        tags_df.drop_duplicates('tag', keep='last')
+                        .set_index('tag')
+                        .to_dict(orient='index')
+                    )
+                else:
+                    self._tag_categories = {}
             except Exception as e:
                 print(f"Warning: Could not load tag categories: {e}")
                 self._tag_categories = {}
@@ -68,63 +154,94 @@ class ClubRecommender:
     def _load_clubs(self) -> pd.DataFrame:
         """Load and prepare club data."""
         if self._clubs_df is None:
-            try:
-                df = pd.read_csv(self.clubs_path, encoding='latin-1')
-            except Exception:
-                df = pd.read_csv(self.clubs_path)
-            
-            # Clean and prepare data
-            df['title'] = df['title'].fillna('')
-            df['mission'] = df['mission'].fillna('')
-            df['tags'] = df['tags'].fillna('')
-            df['membership_benefits'] = df['membership_benefits'].fillna('')
-            df['website'] = df['website'].fillna('')
-            
-            # Extract categories from tags
-            def extract_categories(tag_str):
-                if pd.isna(tag_str) or tag_str == '':
-                    return ''
-                
-                lines = str(tag_str).split('\n')
-                categories = []
-                
-                for line in lines:
-                    if 'Student Organization' in line:
-                        continue
-                    if ' - ' in line:
-                        cats = line.split(' - ', 1)[1] if ' - ' in line else line
-                        categories.append(cats.strip())
-                
-                return ' '.join(categories)
-            
-            df['clean_tags'] = df['tags'].apply(extract_categories)
+            # The cleaned frame, vocabulary and fitted TF-IDF only depend on the
+            # CSVs (and this module), so reuse them across restarts
+            df, vocab, vectorizer, X_tfidf, tag_index, tag_incidence = load_or_build(
+                "club_recommender",
+                (self.clubs_path, self.tags_path, __file__),
+                self._prepare_clubs,
+            )
+            # rapidfuzz scans a list without re-materializing it per lookup.
+            # Sorted so that equal-score typo matches resolve the same way in
+            # every process, whatever the hash seed.
+            self._vocab = sorted(vocab)
+            self._vectorizer = vectorizer
+            self._X_tfidf = X_tfidf
+            self._tag_index = tag_index
+            self._tag_incidence = tag_incidence
+            # Club-to-club cosine similarities for MMR. Dense is only a few MB
+            # for the club corpus and takes milliseconds to build, so it's
+            # recomputed here rather than cached on disk.
+            self._club_sims = (X_tfidf @ X_tfidf.T).toarray()
+            self._bind_query_cache()
+            # Set last: a non-None frame tells other callers everything above is ready
             self._clubs_df = df
-            
-            # Build vocabulary
-            self._vocab = self._build_vocab()
-            
-            # Build TF-IDF
-            self._build_tfidf()
         
         return self._clubs_df
     
-    def _build_vocab(self) -> Set[str]:
+    def _prepare_clubs(self) -> tuple:
+        """Clean club data and fit TF-IDF.
+        
+        Returns (clubs_df, vocab, vectorizer, X_tfidf, tag_index, tag_incidence).
+        """
+        # Only the text columns are used. NA parsing stays on so cells like
+        # "N/A" or "None" are blanked exactly as before
+        read_opts = dict(
+            usecols=['title', 'mission', 'tags', 'membership_benefits', 'website'],
+            dtype=str,
+            engine='c',
+        )
+        try:
+            df = pd.read_csv(self.clubs_path, encoding='latin-1', **read_opts)
+        except Exception:
+            df = pd.read_csv(self.clubs_path, **read_opts)
+        df = df.fillna('')
+        
+        # Extract categories from tags: each tag line looks like "Type - Category";
+        # keep the category part of every line except the "Student Organization" one
+        lines = df['tags'].astype(str).str.split('\n').explode()
+        keep = lines.str.contains(' - ', regex=False) & ~lines.str.contains('Student Organization', regex=False)
+        categories = lines[keep].str.split(' - ', n=1).str[1].str.strip()
+        df['clean_tags'] = categories.groupby(level=0).agg(' '.join).reindex(df.index, fill_value='')
+        # Lowercased once here so tag matching can scan it with vectorized string ops
+        df['clean_tags_lower'] = df['clean_tags'].str.lower()
+        
+        # Build vocabulary
+        vocab = self._build_vocab(df)
+        
+        # Build TF-IDF
+        vectorizer, X_tfidf = self._build_tfidf(df)
+        
+        tag_index, tag_incidence = self._build_tag_incidence(df)
+        
+        return df, vocab, vectorizer, X_tfidf, tag_index, tag_incidence
+    
+    def _build_vocab(self, df: pd.DataFrame) -> Set[str]:
         """Build vocabulary from clubs data."""
-        df = self._clubs_df
         tag_categories = self._load_tag_categories()
         
-        vocab = set()
-        vocab.update(df['clean_tags'].str.lower().str.split().explode().unique())
-        vocab.update(df['title'].str.lower().str.split().explode().unique())
-        vocab.update(df['mission'].str.lower().str.split().explode().unique())
+        # One split/explode/unique pass over all three text columns; clean_tags
+        # is already lowercased on the frame
+        words = pd.concat([df['clean_tags_lower'], df['title'].str.lower(), df['mission'].str.lower()])
+        vocab = set(words.str.split().explode().unique())
         vocab.update([t.lower() for t in tag_categories.keys()])
         vocab = {v for v in vocab if isinstance(v, str) and v.strip()}
         return vocab
     
-    def _build_tfidf(self):
-        """Build TF-IDF vectorizer and transform corpus."""
-        df = self._clubs_df
+    def _build_tag_incidence(self, df: pd.DataFrame):
+        """Build a sparse clubs x known-tags 0/1 matrix of tag substring matches."""
+        club_tags = df["clean_tags_lower"]
+        known_tags = sorted({
+            t.lower() for t in self._load_tag_categories() if isinstance(t, str)
+        })
+        tag_index = {tag: j for j, tag in enumerate(known_tags)}
         
+        columns = [club_tags.str.contains(tag, regex=False).to_numpy() for tag in known_tags]
+        dense = np.column_stack(columns) if columns else np.zeros((len(club_tags), 0))
+        return tag_index, sparse.csr_matrix(dense, dtype=np.float64)
+    
+    def _build_tfidf(self, df: pd.DataFrame):
+        """Build TF-IDF vectorizer and transform corpus; returns (vectorizer, X_tfidf)."""
         def build_text(df: pd.DataFrame) -> pd.Series:
             return (
                 df["title"].fillna("").astype(str) + " " +
@@ -133,13 +250,33 @@ class ClubRecommender:
             )
         
         corpus = build_text(df)
-        self._vectorizer = TfidfVectorizer(
+        vectorizer = TfidfVectorizer(
             max_df=0.7,
             min_df=2,
             ngram_range=(1, 2),
-            stop_words="english"
+            stop_words="english",
+            # Rows come out unit-length, so cosine similarity is a plain sparse dot product
+            norm="l2",
+            dtype=np.float32,
         )
-        self._X_tfidf = self._vectorizer.fit_transform(corpus)
+        return vectorizer, vectorizer.fit_transform(corpus).tocsr()
+    
+    def _bind_query_cache(self):
+        """(Re)create the query-vector cache for the current vectorizer."""
+        # Interest strings repeat across requests (and across the combined
+        # endpoint's fields), so cache their query vectors per vectorizer
+        vectorizer = self._vectorizer
+        
+        @lru_cache(maxsize=1024)
+        def transform_query(text: str):
+            return vectorizer.transform([text])
+        
+        self._transform_query = transform_query
+    
+    def _vectorize_query(self, text: str):
+        """Return the TF-IDF query vector for text, memoized on its normalized form."""
+        # The vectorizer lowercases and tokenizes, so this key is lossless
+        return self._transform_query(text.strip().lower())
     
     def _merge_related_tags(self, user_interests: List[str], tag_categories: Dict) -> Set[str]:
         """Smart tag merging using actual categories."""
@@ -147,65 +284,7 @@ class ClubRecommender:
         
         interests_str = ' '.join(user_interests).lower()
         
-        tag_rules = {
-            'sports': ['Athletic & Recreation', 'Club Sports'],
-            'sport': ['Athletic & Recreation', 'Club Sports'],
-            'athletic': ['Athletic & Recreation', 'Club Sports'],
-            'fitness': ['Athletic & Recreation', 'Club Sports'],
-            'exercise': ['Athletic & Recreation', 'Club Sports'],
-            'gym': ['Athletic & Recreation', 'Club Sports'],
-            'business': ['Business'],
-            'professional': ['Business'],
-            'career': ['Business'],
-            'engineering': ['Engineering & Mathematics'],
-            'math': ['Engineering & Mathematics'],
-            'art': ['Media Arts', 'Performance Arts'],
-            'music': ['Performance Arts'],
-            'dance': ['Performance Arts'],
-            'theater': ['Performance Arts'],
-            'theatre': ['Performance Arts'],
-            'performance': ['Performance Arts'],
-            'creative': ['Media Arts', 'Performance Arts'],
-            'volunteer': ['Community Service & Philanthropy'],
-            'service': ['Community Service & Philanthropy'],
-            'community': ['Community Service & Philanthropy'],
-            'philanthropy': ['Community Service & Philanthropy'],
-            'social': ['Social & Leisure', 'Community Service & Philanthropy'],
-            'technology': ['Technology'],
-            'tech': ['Technology'],
-            'computer': ['Technology', 'Information & Data Sciences'],
-            'programming': ['Technology'],
-            'coding': ['Technology'],
-            'data': ['Information & Data Sciences'],
-            'science': ['Life & Physical Sciences', 'Social & Behavioral Sciences'],
-            'stem': ['Technology', 'Engineering & Mathematics', 'Life & Physical Sciences'],
-            'culture': ['Identity & Culture'],
-            'cultural': ['Identity & Culture'],
-            'identity': ['Identity & Culture'],
-            'international': ['International'],
-            'health': ['Health & Wellness', 'Health & Human Sciences'],
-            'medical': ['Health & Wellness'],
-            'medicine': ['Health & Wellness'],
-            'wellness': ['Health & Wellness'],
-            'activism': ['Advocacy & Activism'],
-            'advocacy': ['Advocacy & Activism'],
-            'justice': ['Advocacy & Activism'],
-            'education': ['Education', 'Pedagogy & Instruction'],
-            'teaching': ['Education', 'Pedagogy & Instruction'],
-            'faith': ['Faith', 'Religion & Spirituality'],
-            'religion': ['Religion & Spirituality'],
-            'spiritual': ['Religion & Spirituality'],
-            'greek': ['Social Fraternities & Sororities'],
-            'fraternity': ['Social Fraternities & Sororities'],
-            'sorority': ['Social Fraternities & Sororities'],
-            'environment': ['Environmental & Sustainability'],
-            'sustainability': ['Environmental & Sustainability'],
-            'politics': ['Ideology & Politics'],
-            'political': ['Ideology & Politics'],
-            'law': ['Law'],
-        }
-        
-        for keyword, tags in tag_rules.items():
+        for keyword, tags in _TAG_RULES.items():
             if keyword in interests_str:
                 merged_tags.update(tags)
         
@@ -215,6 +294,49 @@ class ClubRecommender:
         
         return merged_tags
     
+    def _compute_tag_matches(self, tag_lower: str) -> np.ndarray:
+        """0/1 per club for whether its tags contain tag_lower (memoized via _tag_matches)."""
+        df = self._load_clubs()
+        # Substring match, so multi-word categories like "athletic & recreation" still hit
+        matches = df["clean_tags_lower"].str.contains(tag_lower, regex=False).to_numpy(dtype=np.float64)
+        # Shared between requests through the cache
+        matches.flags.writeable = False
+        return matches
+    
+    def _compute_tag_adjustment(self, merged_tags: tuple, avoid_tags: tuple) -> np.ndarray:
+        """Per-club score offset from preferred and avoided tags (memoized via _tag_adjustment)."""
+        n_clubs = len(self._load_clubs())
+        tag_index = self._tag_index
+        
+        # Per-tag match counts: known categories are tallied into selector
+        # vectors for one sparse mat-vec; anything else falls back to a scan
+        merged_counts = np.zeros(len(tag_index))
+        avoid_counts = np.zeros(len(tag_index))
+        matches = np.zeros(n_clubs)
+        penalties = np.zeros(n_clubs)
+        for tags, counts, totals in (
+            (merged_tags, merged_counts, matches),
+            (avoid_tags, avoid_counts, penalties),
+        ):
+            for tag in tags:
+                tag_lower = tag.lower()
+                j = tag_index.get(tag_lower)
+                if j is not None:
+                    counts[j] += 1
+                else:
+                    totals += self._tag_matches(tag_lower)
+        
+        if merged_tags:
+            matches += self._tag_incidence @ merged_counts
+        if avoid_tags:
+            penalties += self._tag_incidence @ avoid_counts
+        
+        # Tag matching boost and tag avoidance penalty
+        adjustment = 0.2 * matches - 0.3 * penalties
+        # Shared between requests through the cache
+        adjustment.flags.writeable = False
+        return adjustment
+    
     def _fix_typo(self, text_or_list, vocab):
         """Fix typos in user input using fuzzy matching."""
         if isinstance(text_or_list, str):
@@ -224,8 +346,13 @@ class ClubRecommender:
         cleaned = []
         for word in items:
             if word.strip():
-                match, score = process.extractOne(word, vocab)
-                cleaned.append(match if score > 70 else word)
+                # fuzzywuzzy compared round(score) > 70; round() is half-to-even, so
+                # a score of exactly 70.5 still fails
+                result = process.extractOne(
+                    word, vocab, scorer=fuzz.WRatio,
+                    processor=fuzz_utils.default_process, score_cutoff=70,
+                )
+                cleaned.append(result[0] if result and round(result[1]) > 70 else word)
         return cleaned
     
     def recommend_clubs(
@@ -248,15 +375,30 @@ class ClubRecommender:
         Returns:
             List of recommended clubs with scores
         """
+        # Canonicalize to a hashable key without changing what the pipeline sees:
+        # _fix_typo lowercases and splits the interests on whitespace/commas, and
+        # tag order never matters (duplicates do, so they are kept)
+        interests_key = ' '.join(interests.lower().replace(',', ' ').split())
+        preferred_key = tuple(sorted(t.lower() for t in preferred_tags or ()))
+        avoid_key = tuple(sorted(t.lower() for t in avoid_tags or ()))
+        
+        cached = self._recommend_cached(interests_key, preferred_key, avoid_key, topk, mmr_lambda)
+        # Fresh dicts so callers can't modify the cached entries
+        return [dict(rec) for rec in cached]
+    
+    def _compute_recommendations(
+        self,
+        interests: str,
+        preferred_tags: Tuple[str, ...],
+        avoid_tags: Tuple[str, ...],
+        topk: int,
+        mmr_lambda: float
+    ) -> Tuple[Dict, ...]:
+        """Score and diversify clubs for canonicalized inputs (memoized via _recommend_cached)."""
         # Load data if not already loaded
         df = self._load_clubs()
         tag_categories = self._load_tag_categories()
         
-        if preferred_tags is None:
-            preferred_tags = []
-        if avoid_tags is None:
-            avoid_tags = []
-        
         # Fix typos
         vocab = self._vocab
         interests_words = self._fix_typo(interests, vocab)
@@ -269,58 +411,55 @@ class ClubRecommender:
         merged_tags = self._merge_related_tags(all_interests, tag_categories)
         
         # Vectorize interests
-        query_vec = self._vectorizer.transform([interests])
-        sims = cosine_similarity(query_vec, self._X_tfidf).flatten()
-        
-        # Tag matching boost
-        tag_boost = np.zeros(len(df))
-        if merged_tags:
-            for i, row in df.iterrows():
-                club_tags = str(row.get("clean_tags", "")).lower()
-                matches = sum(1 for tag in merged_tags if tag.lower() in club_tags)
-                tag_boost[i] = 0.2 * matches
+        query_vec = self._vectorize_query(interests)
+        # TF-IDF rows are L2-normalized, so a sparse dot product is the cosine similarity
+        sims = (self._X_tfidf @ query_vec.T).toarray().ravel()
         
-        # Tag avoidance penalty
-        tag_penalty = np.zeros(len(df))
-        if avoid_tags:
-            for i, row in df.iterrows():
-                club_tags = str(row.get("clean_tags", "")).lower()
-                penalties = sum(1 for tag in avoid_tags if tag.lower() in club_tags)
-                tag_penalty[i] = -0.3 * penalties
+        # Tag matching boost and avoidance penalty
+        tag_adjustment = self._tag_adjustment(
+            tuple(sorted(merged_tags)), tuple(sorted(avoid_tags))
+        )
         
         # Combined score
-        scores = sims + tag_boost + tag_penalty
+        scores = sims + tag_adjustment
         
         # MMR diversification
-        def mmr_diversify(scores, X, topk, lambda_param=0.7):
-            selected = []
-            candidates = np.arange(len(scores))
+        def mmr_diversify(scores, S, topk, lambda_param=0.7):
+            # Long-tail clubs never win a slot, so run MMR over an over-fetched
+            # pool of the best-scoring ones. Everything tied with the cutoff
+            # score stays in (e.g. a blank query where all scores are equal),
+            # and flatnonzero keeps indices ascending so ties resolve as before.
+            n_pool = topk * 10
+            if n_pool < len(scores):
+                cutoff = np.partition(scores, len(scores) - n_pool)[len(scores) - n_pool]
+                pool = np.flatnonzero(scores >= cutoff)
+            else:
+                pool = np.arange(len(scores))
+            n_pool = len(pool)
+            pool_scores = scores[pool]
             
-            first = np.argmax(scores)
-            selected.append(first)
-            candidates = np.delete(candidates, np.where(candidates == first))
+            first = int(np.argmax(pool_scores))
+            selected = [first]
+            selected_mask = np.zeros(n_pool, dtype=bool)
+            selected_mask[first] = True
+            # Running max similarity of every pool club to the selected set;
+            # each round only adds the newest pick's similarities
+            max_sim = np.full(n_pool, -np.inf)
             
-            while len(selected) < topk and len(candidates) > 0:
-                mmr_scores = []
-                for c in candidates:
-                    relevance = scores[c]
-                    if len(selected) > 0:
-                        sims_to_selected = cosine_similarity(X[c:c+1], X[selected]).flatten()
-                        max_sim = np.max(sims_to_selected)
-                    else:
-                        max_sim = 0
-                    mmr = lambda_param * relevance - (1 - lambda_param) * max_sim
-                    mmr_scores.append(mmr)
+            while len(selected) < min(topk, n_pool):
+                new_sims = S[pool[selected[-1]], pool]
+                np.maximum(max_sim, new_sims, out=max_sim)
+                mmr_scores = lambda_param * pool_scores - (1 - lambda_param) * max_sim
+                mmr_scores[selected_mask] = -np.inf
                 
-                best_idx = np.argmax(mmr_scores)
-                best_candidate = candidates[best_idx]
+                best_candidate = int(np.argmax(mmr_scores))
                 selected.append(best_candidate)
-                candidates = np.delete(candidates, best_idx)
+                selected_mask[best_candidate] = True
             
-            return selected
+            return pool[selected]
         
         # Get diverse recommendations
-        top_indices = mmr_diversify(scores, self._X_tfidf, topk, mmr_lambda)
+        top_indices = mmr_diversify(scores, self._club_sims, topk, mmr_lambda)
         
         result = df.iloc[top_indices].copy()
         result["score"] = scores[top_indices]
@@ -338,17 +477,21 @@ class ClubRecommender:
                 "score": float(row.get("score", 0))
             })
         
-        return recommendations
+        return tuple(recommendations)
 
 
 # Singleton instance
 _club_recommender: Optional[ClubRecommender] = None
+_club_recommender_lock = threading.Lock()
 
 
 def get_club_recommender() -> ClubRecommender:
     """Get singleton club recommender instance."""
     global _club_recommender
     if _club_recommender is None:
-        _club_recommender = ClubRecommender()
+        # Startup warmups run on several threads; only one may build the instance
+        with _club_recommender_lock:
+            if _club_recommender is None:
+                _club_recommender = ClubRecommender()
     return _club_recommender
 
@@ -1,7 +1,35 @@
 """Load and cache course and major data."""
-import json
+import mmap
 import os
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, FrozenSet
+
+import orjson
+
+from ..utils.disk_cache import load_or_build
+
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON data file with orjson (several times faster than json.load).
+    
+    The file is memory-mapped and parsed in place, so the multi-MB data files
+    aren't first copied into a bytes object.
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            return orjson.loads(view)
+        finally:
+            # The map can't close while a view of it is still alive
+            view.release()
+
+
+# Default to data_scraping/output/ml_ready
+# Go up from backend/app/services to Project, then to data_scraping
+DEFAULT_DATA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    'data_scraping', 'output', 'ml_ready',
+)
 
 
 class DataLoader:
@@ -13,48 +41,64 @@ class DataLoader:
         Args:
             data_dir: Path to data directory. If None, uses default location.
         """
-        if data_dir is None:
-            # Default to data_scraping/output/ml_ready
-            # Go up from backend/app/services to Project, then to data_scraping
-            script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-            data_dir = os.path.join(script_dir, 'data_scraping', 'output', 'ml_ready')
-        
-        self.data_dir = data_dir
+        self.data_dir = DEFAULT_DATA_DIR if data_dir is None else data_dir
         self._course_graph: Optional[Dict[str, Any]] = None
         self._major_requirements: Optional[Dict[str, Any]] = None
         self._courses_by_code: Optional[Dict[str, Dict]] = None
         self._sample_sequences: Optional[Dict[str, Dict]] = None
+        self._sequence_name_tokens: Optional[Dict[str, FrozenSet[str]]] = None
+        self._cs_sequence: Optional[Dict] = None
+        self._cs_sequence_checked = False
+        self._all_majors: Optional[List[Dict[str, str]]] = None
+        self._major_names: Optional[FrozenSet[str]] = None
     
     def load_course_graph(self) -> Dict[str, Any]:
         """Load course graph from JSON file."""
         if self._course_graph is None:
             graph_path = os.path.join(self.data_dir, 'course_graph.json')
-            with open(graph_path, 'r', encoding='utf-8') as f:
-                self._course_graph = json.load(f)
+            self._course_graph = _read_json(graph_path)
             
-            # Build lookup dictionary for fast course access
-            self._courses_by_code = {}
-            if 'nodes' in self._course_graph:
-                for node in self._course_graph['nodes']:
-                    course_code = node.get('course_code', '')
-                    if course_code:
-                        self._courses_by_code[course_code] = node
+            if self._courses_by_code is None:
+                self._courses_by_code = self._build_courses_by_code(self._course_graph)
         
         return self._course_graph
     
+    def load_courses_by_code(self) -> Dict[str, Dict]:
+        """Load the course-code lookup, from the on-disk cache when the graph is unchanged."""
+        if self._courses_by_code is None:
+            graph_path = os.path.join(self.data_dir, 'course_graph.json')
+            # Unpickling the finished dict skips both the JSON parse and the node walk
+            self._courses_by_code = load_or_build(
+                'courses_by_code',
+                (graph_path, __file__),
+                lambda: self._build_courses_by_code(_read_json(graph_path)),
+            )
+        
+        return self._courses_by_code
+    
+    @staticmethod
+    def _build_courses_by_code(course_graph: Dict[str, Any]) -> Dict[str, Dict]:
+        """Build lookup dictionary for fast course access."""
+        courses_by_code = {}
+        if 'nodes' in course_graph:
+            for node in course_graph['nodes']:
+                course_code = node.get('course_code', '')
+                if course_code:
+                    courses_by_code[course_code] = node
+        return courses_by_code
+    
     def load_major_requirements(self) -> Dict[str, Any]:
         """Load major requirements from JSON file."""
         if self._major_requirements is None:
             majors_path = os.path.join(self.data_dir, 'major_requirements.json')
-            with open(majors_path, 'r', encoding='utf-8') as f:
-                self._major_requirements = json.load(f)
+            self._major_requirements = _read_json(majors_path)
         
         return self._major_requirements
     
     def get_course(self, course_code: str) -> Optional[Dict]:
         """Get course by code."""
         if self._courses_by_code is None:
-            self.load_course_graph()
+            self.load_courses_by_code()
         
         return self._courses_by_code.get(course_code.upper())
     
@@ -66,17 +110,30 @@ class DataLoader:
         return self._major_requirements.get(major_name)
     
     def get_all_majors(self) -> List[Dict[str, str]]:
-        """Get list of all available majors."""
-        if self._major_requirements is None:
-            self.load_major_requirements()
+        """Get list of all available majors (built once, then cached)."""
+        if self._all_majors is None:
+            if self._major_requirements is None:
+                self.load_major_requirements()
+            
+            self._all_majors = [
+                {
+                    'name': name,
+                    'url': data.get('url', '')
+                }
+                for name, data in self._major_requirements.items()
+            ]
         
-        return [
-            {
-                'name': name,
-                'url': data.get('url', '')
-            }
-            for name, data in self._major_requirements.items()
-        ]
+        return self._all_majors
+    
+    def get_major_names(self) -> FrozenSet[str]:
+        """Get the set of all major names for fast existence checks."""
+        if self._major_names is None:
+            if self._major_requirements is None:
+                self.load_major_requirements()
+            
+            self._major_names = frozenset(self._major_requirements)
+        
+        return self._major_names
     
     def load_sample_sequences(self) -> Dict[str, Any]:
         """Load sample sequences from JSON file."""
@@ -84,25 +141,29 @@ class DataLoader:
             # Try to load from consolidated file first (all majors)
             seq_path = os.path.join(self.data_dir, 'sample_sequences.json')
             if os.path.exists(seq_path):
-                with open(seq_path, 'r', encoding='utf-8') as f:
-                    self._sample_sequences = json.load(f)
+                sample_sequences = _read_json(seq_path)
             else:
                 # Fallback: try CS-specific file
-                cs_seq_path = os.path.join(self.data_dir, 'sample_sequence_cs.json')
-                if os.path.exists(cs_seq_path):
-                    with open(cs_seq_path, 'r', encoding='utf-8') as f:
-                        cs_sequence = json.load(f)
-                        # Convert to dict format
-                        self._sample_sequences = {'Computer Science, BS': cs_sequence}
+                cs_sequence = self._load_cs_sequence()
+                if cs_sequence is not None:
+                    # Convert to dict format
+                    sample_sequences = {'Computer Science, BS': cs_sequence}
                 else:
                     # Last fallback: check if sequences are in major_requirements
                     if self._major_requirements is None:
                         self.load_major_requirements()
                     
-                    self._sample_sequences = {}
+                    sample_sequences = {}
                     for major_name, major_data in self._major_requirements.items():
                         if 'sample_sequence' in major_data:
-                            self._sample_sequences[major_name] = major_data['sample_sequence']
+                            sample_sequences[major_name] = major_data['sample_sequence']
+            
+            # Tokenize stored major names once for get_sample_sequence's fuzzy match.
+            # Sequences are published last so readers never see them without tokens.
+            self._sequence_name_tokens = {
+                name: frozenset(name.lower().split()) for name in sample_sequences
+            }
+            self._sample_sequences = sample_sequences
         
         return self._sample_sequences
     
@@ -116,34 +177,42 @@ class DataLoader:
             return self._sample_sequences[major_name]
         
         # Try fuzzy matching (e.g., "Computer Science, BS" vs "Computer Science")
-        for stored_name, sequence in self._sample_sequences.items():
-            # Check if major_name contains key parts of stored_name or vice versa
-            major_keywords = set(major_name.lower().split())
-            stored_keywords = set(stored_name.lower().split())
-            
+        major_keywords = frozenset(major_name.lower().split())
+        for stored_name, stored_keywords in self._sequence_name_tokens.items():
             # If there's significant overlap, it's likely the same major
-            if len(major_keywords.intersection(stored_keywords)) >= 2:
-                return sequence
+            if len(major_keywords & stored_keywords) >= 2:
+                return self._sample_sequences[stored_name]
         
         # For CS specifically, try loading from file
         if 'Computer Science' in major_name:
+            return self._load_cs_sequence()
+        
+        return None
+    
+    def _load_cs_sequence(self) -> Optional[Dict]:
+        """Load sample_sequence_cs.json once; None if the file doesn't exist."""
+        if not self._cs_sequence_checked:
             seq_path = os.path.join(self.data_dir, 'sample_sequence_cs.json')
             if os.path.exists(seq_path):
-                with open(seq_path, 'r', encoding='utf-8') as f:
-                    cs_sequence = json.load(f)
-                    return cs_sequence
+                self._cs_sequence = _read_json(seq_path)
+            # Set last so a concurrent caller never sees the flag before the data
+            self._cs_sequence_checked = True
         
-        return None
+        return self._cs_sequence
 
 
 # Global instance
 _data_loader: Optional[DataLoader] = None
+_data_loader_lock = threading.Lock()
 
 
 def get_data_loader() -> DataLoader:
     """Get or create global data loader instance."""
     global _data_loader
     if _data_loader is None:
-        _data_loader = DataLoader()
+        # Startup warmups run on several threads; only one may build the instance
+        with _data_loader_lock:
+            if _data_loader is None:
+                _data_loader = DataLoader()
     return _data_loader
 
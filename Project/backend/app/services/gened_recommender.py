@@ -2,10 +2,14 @@
 import pandas as pd
 import numpy as np
 import os
-from typing import Dict, List, Optional
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-from fuzzywuzzy import process
+from rapidfuzz import fuzz, process, utils as fuzz_utils
+
+from ..utils.disk_cache import load_or_build
 
 
 class GenedRecommender:
@@ -25,10 +29,13 @@ class GenedRecommender:
         self._courses_df: Optional[pd.DataFrame] = None
         self._vectorizer: Optional[TfidfVectorizer] = None
         self._X_tfidf = None
-        self._vocab: Optional[set] = None
+        self._transform_query = None
+        self._vocab: Optional[List[str]] = None
+        # Interest words repeat across requests, so corrections are memoized
+        self._correct_word = lru_cache(maxsize=8192)(self._match_vocab)
     
-    def warmup(self) -> None:
-        """Pre-load all data to avoid first-request delays."""
+    def warmup(self) -> bool:
+        """Pre-load all data to avoid first-request delays; returns False if loading failed."""
         import logging
         import time
         logger = logging.getLogger(__name__)
@@ -38,92 +45,114 @@ class GenedRecommender:
         
         try:
             self._load_courses()  # This also builds TF-IDF
+            # Run one tiny query so the scoring path is exercised before real traffic
+            self.recommend_courses(interests="history", topk=1)
             logger.info(f"[GenedRecommender] Warmup completed in {time.time() - start:.2f}s")
+            return True
         except Exception as e:
             logger.error(f"[GenedRecommender] Warmup failed: {e}", exc_info=True)
+            return False
     
     def _load_courses(self) -> pd.DataFrame:
         """Load and prepare GenEd course data."""
         if self._courses_df is None:
-            try:
-                df = pd.read_csv(self.data_path, encoding='latin-1')
-            except Exception:
-                df = pd.read_csv(self.data_path)
-            
-            # Rename columns
-            df = df.rename(columns={
-                'COURSE': 'code_key',
-                'TITLE': 'title',
-                'Average_GPA': 'gpa'
-            })
-            
-            # Extract subject and number
-            if 'subject' not in df.columns:
-                df[['subject', 'number']] = df['code_key'].str.split(r'\s+', n=1, expand=True)
-            
-            # Build gened categories
-            gened_cols = ['ACP', 'CS', 'COMP1', 'HUM', 'NAT', 'QR', 'SBS']
-            def make_gened(row):
-                categories = []
-                for col in gened_cols:
-                    if col in row and pd.notna(row[col]) and row[col] != '':
-                        categories.append(col)
-                # Add cultural studies tags
-                if 'US' in str(row.get('CS', '')):
-                    categories.append('US')
-                if 'WCC' in str(row.get('CS', '')):
-                    categories.append('WCC')
-                if 'NW' in str(row.get('CS', '')):
-                    categories.append('NW')
-                return ' '.join(categories)
-            
-            df['gened'] = df.apply(make_gened, axis=1)
-            
-            # Create tags from keywords
-            vocab = [
-                "humanities", "social", "natural", "arts", "composition", "advanced", "lab",
-                "cs", "computer", "programming", "math", "statistics", "finance", "economics",
-                "history", "biology", "chemistry", "psychology", "design", "business",
-                "communication", "media", "society", "writing", "data", "engineering",
-                "science", "literature", "culture", "language", "philosophy", "ethics",
-                "environment", "health", "education", "political", "gender", "race",
-                "architecture", "music", "dance", "theater", "film", "art"
-            ]
-            
-            def make_tags(row):
-                txt = f"{row.get('title', '')} {row.get('gened', '')}".lower()
-                return ", ".join(sorted({t for t in vocab if t in txt}))
-            
-            df['tags'] = df.apply(make_tags, axis=1)
-            
-            # Clean data
-            df['title'] = df['title'].fillna('')
-            df['gened'] = df['gened'].fillna('')
-            df['tags'] = df['tags'].fillna('')
-            df['gpa'] = pd.to_numeric(df['gpa'], errors='coerce').fillna(0)
-            
+            # The cleaned frame, vocabulary and fitted TF-IDF only depend on the
+            # CSV (and this module), so reuse them across restarts
+            df, vocab, vectorizer, X_tfidf = load_or_build(
+                "gened_recommender",
+                (self.data_path, __file__),
+                self._prepare_courses,
+            )
+            # rapidfuzz scans a list without re-materializing it per lookup.
+            self._vocab = sorted(vocab)
+            self._vectorizer = vectorizer
+            self._X_tfidf = X_tfidf
+            self._bind_query_cache()
+            # Set last: a non-None frame tells other callers everything above is ready
             self._courses_df = df
-            
-            # Build vocabulary
-            self._vocab = self._build_vocab()
-            
-            # Build TF-IDF
-            self._build_tfidf()
         
         return self._courses_df
     
-    def _build_vocab(self) -> set:
+    def _prepare_courses(self) -> tuple:
+        """Clean GenEd course data and fit TF-IDF.
+        
+        Returns (courses_df, vocab, vectorizer, X_tfidf).
+        """
+        try:
+            df = pd.read_csv(self.data_path, encoding='latin-1')
+        except Exception:
+            df = pd.read_csv(self.data_path)
+        
+        # Rename columns
+        df = df.rename(columns={
+            'COURSE': 'code_key',
+            'TITLE': 'title',
+            'Average_GPA': 'gpa'
+        })
+        
+        # Extract subject and number
+        if 'subject' not in df.columns:
+            df[['subject', 'number']] = df['code_key'].str.split(r'\s+', n=1, expand=True)
+        
+        # Build gened categories: one vectorized pass per column, space-joined
+        # in column order
+        gened_cols = ['ACP', 'CS', 'COMP1', 'HUM', 'NAT', 'QR', 'SBS']
+        gened = pd.Series('', index=df.index)
+        for col in gened_cols:
+            if col in df.columns:
+                present = df[col].notna() & (df[col] != '')
+                gened += np.where(present, col + ' ', '')
+        # Add cultural studies tags
+        cs_text = df['CS'].astype(str) if 'CS' in df.columns else pd.Series('', index=df.index)
+        for tag in ('US', 'WCC', 'NW'):
+            gened += np.where(cs_text.str.contains(tag, regex=False), tag + ' ', '')
+        df['gened'] = gened.str.rstrip()
+        
+        # Create tags from keywords
+        tag_vocab = [
+            "humanities", "social", "natural", "arts", "composition", "advanced", "lab",
+            "cs", "computer", "programming", "math", "statistics", "finance", "economics",
+            "history", "biology", "chemistry", "psychology", "design", "business",
+            "communication", "media", "society", "writing", "data", "engineering",
+            "science", "literature", "culture", "language", "philosophy", "ethics",
+            "environment", "health", "education", "political", "gender", "race",
+            "architecture", "music", "dance", "theater", "film", "art"
+        ]
+        
+        # Substring test each keyword against every row at once; keywords are
+        # visited in sorted order so the joined tags come out sorted
+        txt = (df['title'].astype(str) + ' ' + df['gened']).str.lower()
+        tags = pd.Series('', index=df.index)
+        for t in sorted(tag_vocab):
+            tags += np.where(txt.str.contains(t, regex=False), t + ', ', '')
+        df['tags'] = tags.str[:-2]
+        
+        # Clean data
+        df['title'] = df['title'].fillna('')
+        df['gened'] = df['gened'].fillna('')
+        df['tags'] = df['tags'].fillna('')
+        df['gpa'] = pd.to_numeric(df['gpa'], errors='coerce').fillna(0)
+        # Uppercased once here so preference/avoid matching can use vectorized ops
+        df['gened_upper'] = df['gened'].astype(str).str.upper()
+        df['subject_upper'] = df['subject'].astype(str).str.upper()
+        
+        # Build vocabulary
+        vocab = self._build_vocab(df)
+        
+        # Build TF-IDF
+        vectorizer, X_tfidf = self._build_tfidf(df)
+        
+        return df, vocab, vectorizer, X_tfidf
+    
+    def _build_vocab(self, df: pd.DataFrame) -> Set[str]:
         """Build vocabulary from courses data."""
-        df = self._courses_df
         valid = set()
         valid.update(df['subject'].str.lower().unique())
         valid.update(df['tags'].str.lower().str.split(',').explode().str.strip().unique())
         return valid
     
-    def _build_tfidf(self):
-        """Build TF-IDF vectorizer and transform corpus."""
-        df = self._courses_df
-        
+    def _build_tfidf(self, df: pd.DataFrame):
+        """Build TF-IDF vectorizer and transform corpus; returns (vectorizer, X_tfidf)."""
         def build_text(df: pd.DataFrame) -> pd.Series:
             return (
                 df["title"].fillna("").astype(str) + " " +
@@ -132,25 +161,51 @@ class GenedRecommender:
             )
         
         corpus = build_text(df)
-        self._vectorizer = TfidfVectorizer(
+        vectorizer = TfidfVectorizer(
             max_df=0.7,
             min_df=2,
             ngram_range=(1, 2),
-            stop_words="english"
+            stop_words="english",
+            dtype=np.float32,
         )
-        self._X_tfidf = self._vectorizer.fit_transform(corpus)
+        return vectorizer, vectorizer.fit_transform(corpus)
+    
+    def _bind_query_cache(self):
+        """(Re)create the query-vector cache for the current vectorizer."""
+        # Interest strings repeat across requests (and across the combined
+        # endpoint's fields), so cache their query vectors per vectorizer
+        vectorizer = self._vectorizer
+        
+        @lru_cache(maxsize=1024)
+        def transform_query(text: str):
+            return vectorizer.transform([text])
+        
+        self._transform_query = transform_query
+    
+    def _vectorize_query(self, text: str):
+        """Return the TF-IDF query vector for text, memoized on its normalized form."""
+        # The vectorizer lowercases and tokenizes, so this key is lossless
+        return self._transform_query(text.strip().lower())
     
     def _fix_typo(self, text, courses_df):
         """Fix typos in user input using fuzzy matching."""
-        valid = self._vocab
         fixed = []
         for word in text.lower().split(','):
             word = word.strip()
             if word:
-                match, score = process.extractOne(word, valid)
-                fixed.append(match if score > 70 else word)
+                fixed.append(self._correct_word(word))
         return fixed
     
+    def _match_vocab(self, word: str) -> str:
+        """Return the closest vocabulary entry for word, or word if none is close."""
+        # fuzzywuzzy compared round(score) > 70; round() is half-to-even, so
+        # a score of exactly 70.5 still fails
+        result = process.extractOne(
+            word, self._vocab, scorer=fuzz.WRatio,
+            processor=fuzz_utils.default_process, score_cutoff=70,
+        )
+        return result[0] if result and round(result[1]) > 70 else word
+    
     def recommend_courses(
         self,
         interests: str = "",
@@ -186,8 +241,9 @@ class GenedRecommender:
         avoid_subjects = self._fix_typo(",".join(avoid_subjects), df) if avoid_subjects else []
         
         # Vectorize interests
-        query_vec = self._vectorizer.transform([interests_fixed])
-        sims = cosine_similarity(query_vec, self._X_tfidf).flatten()
+        query_vec = self._vectorize_query(interests_fixed)
+        # TF-IDF rows are L2-normalized, so a sparse dot product is the cosine similarity
+        sims = (self._X_tfidf @ query_vec.T).toarray().ravel()
         
         # GPA boost
         gpa_boost = np.where(
@@ -196,53 +252,44 @@ class GenedRecommender:
             0.0
         )
         
-        # GenEd matching boost
-        gened_boost = np.zeros(len(df))
-        if gened_preferences:
-            for i, row in df.iterrows():
-                gened_str = str(row.get("gened", "")).upper()
-                matches = sum(1 for pref in gened_preferences if pref.upper() in gened_str)
-                gened_boost[i] = 0.15 * matches
+        # GenEd matching boost: one vectorized substring scan per preference
+        gened_matches = np.zeros(len(df))
+        for pref in gened_preferences:
+            gened_matches += df["gened_upper"].str.contains(pref.upper(), regex=False).to_numpy()
+        gened_boost = 0.15 * gened_matches
         
         # Subject avoidance penalty
         subject_penalty = np.zeros(len(df))
         if avoid_subjects:
-            for i, row in df.iterrows():
-                subj = str(row.get("subject", "")).upper()
-                if subj in [s.upper() for s in avoid_subjects]:
-                    subject_penalty[i] = -0.5
+            avoided = df["subject_upper"].isin([s.upper() for s in avoid_subjects]).to_numpy()
+            subject_penalty[avoided] = -0.5
         
         # Combined score
         scores = sims + gpa_boost + gened_boost + subject_penalty
         
         # MMR diversification
         def mmr_diversify(scores, X, topk, lambda_param=0.7):
-            selected = []
-            candidates = np.arange(len(scores))
+            n = len(scores)
+            first = int(np.argmax(scores))
+            selected = [first]
+            # Chosen courses are masked out instead of np.delete-ing a candidate array
+            selected_mask = np.zeros(n, dtype=bool)
+            selected_mask[first] = True
+            # Running max similarity of every course to the selected set; each
+            # round only adds the newest pick's similarities
+            max_sim = np.full(n, -np.inf)
             
-            first = np.argmax(scores)
-            selected.append(first)
-            candidates = np.delete(candidates, np.where(candidates == first))
-            
-            while len(selected) < topk and len(candidates) > 0:
-                mmr_scores = []
-                for c in candidates:
-                    relevance = scores[c]
-                    if len(selected) > 0:
-                        sims_to_selected = cosine_similarity(
-                            X[c:c+1], X[selected]
-                        ).flatten()
-                        max_sim = np.max(sims_to_selected)
-                    else:
-                        max_sim = 0
-                    
-                    mmr = lambda_param * relevance - (1 - lambda_param) * max_sim
-                    mmr_scores.append(mmr)
+            while len(selected) < min(topk, n):
+                last = selected[-1]
+                new_sims = cosine_similarity(X, X[last:last+1]).ravel()
+                np.maximum(max_sim, new_sims, out=max_sim)
+                
+                mmr_scores = lambda_param * scores - (1 - lambda_param) * max_sim
+                mmr_scores[selected_mask] = -np.inf
                 
-                best_idx = np.argmax(mmr_scores)
-                best_candidate = candidates[best_idx]
+                best_candidate = int(np.argmax(mmr_scores))
                 selected.append(best_candidate)
-                candidates = np.delete(candidates, best_idx)
+                selected_mask[best_candidate] = True
             
             return selected
         
@@ -270,12 +317,16 @@ class GenedRecommender:
 
 # Singleton instance
 _gened_recommender: Optional[GenedRecommender] = None
+_gened_recommender_lock = threading.Lock()
 
 
 def get_gened_recommender() -> GenedRecommender:
     """Get singleton gened recommender instance."""
     global _gened_recommender
     if _gened_recommender is None:
-        _gened_recommender = GenedRecommender()
+        # Startup warmups run on several threads; only one may build the instance
+        with _gened_recommender_lock:
+            if _gened_recommender is None:
+                _gened_recommender = GenedRecommender()
     return _gened_recommender
 
@@ -1,14 +1,23 @@
 """Check if prerequisites are satisfied."""
 import re
+from functools import lru_cache
 from typing import List, Set, Tuple
 
+# Split "DEPT123" / "DEPT 123" into department and number
+_CODE_RE = re.compile(r'^([A-Z]{2,4})\s*(\d{3}[A-Z]?)$')
 
+
+@lru_cache(maxsize=4096)
 def normalize_course_code(code: str) -> str:
-    """Normalize course code format."""
+    """Normalize course code format.
+    
+    Memoized: the same few hundred codes are normalized over and over while
+    checking prerequisites.
+    """
     # Remove extra spaces and convert to uppercase
     code = code.strip().upper()
     # Ensure format is "DEPT 123" not "DEPT123"
-    match = re.match(r'^([A-Z]{2,4})\s*(\d{3}[A-Z]?)$', code)
+    match = _CODE_RE.match(code)
     if match:
         return f"{match.group(1)} {match.group(2)}"
     return code
@@ -51,7 +60,8 @@ def parse_prerequisite_string(prereq_str: str) -> List[List[str]]:
 
 def check_prerequisites_met(
     prerequisites: List[str],
-    completed_courses: Set[str]
+    completed_courses: Set[str],
+    assume_normalized: bool = False
 ) -> Tuple[bool, List[str]]:
     """Check if prerequisites are satisfied.
     
@@ -60,7 +70,9 @@ def check_prerequisites_met(
     
     Args:
         prerequisites: List of prerequisite course codes (each is an OR option)
-        completed_courses: Set of completed course codes (normalized)
+        completed_courses: Set of completed course codes
+        assume_normalized: Skip re-normalizing completed_courses when the caller
+            already built the set from normalize_course_code output
     
     Returns:
         Tuple of (all_met: bool, missing: List[str])
@@ -69,7 +81,10 @@ def check_prerequisites_met(
         return True, []
     
     # Normalize completed courses
-    completed_normalized = {normalize_course_code(c) for c in completed_courses}
+    if assume_normalized:
+        completed_normalized = completed_courses
+    else:
+        completed_normalized = {normalize_course_code(c) for c in completed_courses}
     
     # Check if ANY prerequisite is satisfied (OR logic)
     # This handles cases where prerequisites are listed as alternatives
@@ -84,7 +99,8 @@ def check_prerequisites_met(
             if or_groups:
                 # Check if any course in any OR group is completed
                 for or_group in or_groups:
-                    if any(normalize_course_code(c) in completed_normalized for c in or_group):
+                    # C-level set test that still stops at the first completed option
+                    if not completed_normalized.isdisjoint(map(normalize_course_code, or_group)):
                         satisfied = True
                         break
                 if satisfied:
@@ -115,7 +131,8 @@ def check_prerequisites_met(
 def can_take_course(
     course_code: str,
     completed_courses: Set[str],
-    course_data: dict
+    course_data: dict,
+    assume_normalized: bool = False
 ) -> Tuple[bool, List[str]]:
     """Check if a course can be taken given completed courses.
     
@@ -123,10 +140,11 @@ def can_take_course(
         course_code: Course code to check
         completed_courses: Set of completed course codes
         course_data: Course data dictionary with prerequisites
+        assume_normalized: Passed through to check_prerequisites_met
     
     Returns:
         Tuple of (can_take: bool, missing_prerequisites: List[str])
     """
     prerequisites = course_data.get('prerequisites', [])
-    return check_prerequisites_met(prerequisites, completed_courses)
+    return check_prerequisites_met(prerequisites, completed_courses, assume_normalized)
 
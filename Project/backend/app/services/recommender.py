@@ -1,5 +1,6 @@
 """Rule-based course recommendation engine."""
 import re
+import threading
 from typing import List, Set, Dict, Any, Optional
 from .data_loader import get_data_loader
 from .prereq_checker import can_take_course, normalize_course_code
@@ -12,15 +13,22 @@ class Recommender:
     def __init__(self):
         """Initialize recommender with data loader."""
         self.data_loader = get_data_loader()
-        self.data_loader.load_course_graph()
+        self.data_loader.load_courses_by_code()
         self.data_loader.load_major_requirements()
+        self._major_courses: Dict[str, Dict[str, Any]] = {}
     
     def get_major_courses(self, major_name: str) -> Dict[str, Any]:
         """Get all courses for a major.
         
+        Results are cached per major, since requirements don't change at runtime.
+        
         Returns:
             Dictionary with 'required', 'electives', and 'focus_areas' lists
         """
+        cached = self._major_courses.get(major_name)
+        if cached is not None:
+            return cached
+        
         major_data = self.data_loader.get_major(major_name)
         if not major_data:
             return {'required': [], 'electives': [], 'focus_areas': []}
@@ -48,11 +56,13 @@ class Recommender:
                         # For now, assume all courses in requirement groups are required
                         required_courses.append(course)
         
-        return {
+        courses = {
             'required': required_courses,
             'electives': elective_courses,
             'focus_areas': focus_areas
         }
+        self._major_courses[major_name] = courses
+        return courses
     
     def recommend_courses(
         self,
@@ -119,11 +129,12 @@ class Recommender:
             if not course_code:
                 continue
             
-            # Check if prerequisites are met
+            # Check if prerequisites are met (completed_set is already normalized)
             can_take, missing = can_take_course(
                 course_code,
                 completed_set,
-                course
+                course,
+                assume_normalized=True
             )
             
             if can_take:
@@ -279,12 +290,16 @@ class Recommender:
 
 # Global instance
 _recommender: Optional[Recommender] = None
+_recommender_lock = threading.Lock()
 
 
 def get_recommender() -> Recommender:
     """Get or create global recommender instance."""
     global _recommender
     if _recommender is None:
-        _recommender = Recommender()
+        # Startup warmups run on several threads; only one may build the instance
+        with _recommender_lock:
+            if _recommender is None:
+                _recommender = Recommender()
     return _recommender
 
@@ -2,13 +2,13 @@
 import pandas as pd
 import numpy as np
 import os
+import threading
 import re
-import json
 from pathlib import Path
 from typing import Dict, List, Set, Optional
+import orjson
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-from fuzzywuzzy import process
 
 from .prereq_checker import can_take_course, normalize_course_code
 from .year_detector import detect_student_year
@@ -53,8 +53,8 @@ class TechnicalRecommender:
         self._all_courses_df: Optional[pd.DataFrame] = None
         self._majors_data: Optional[Dict] = None
     
-    def warmup(self) -> None:
-        """Pre-load all data to avoid first-request delays."""
+    def warmup(self) -> bool:
+        """Pre-load all data to avoid first-request delays; returns False if loading failed."""
         import logging
         import time
         logger = logging.getLogger(__name__)
@@ -80,13 +80,15 @@ class TechnicalRecommender:
             logger.info(f"[TechnicalRecommender] Loaded course data in {time.time() - t0:.2f}s")
             
             logger.info(f"[TechnicalRecommender] Warmup completed in {time.time() - start:.2f}s")
+            return True
         except Exception as e:
             logger.error(f"[TechnicalRecommender] Warmup failed: {e}", exc_info=True)
+            return False
     
     def _load_json(self, filepath: str) -> Dict:
-        """Load JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """Load JSON file (orjson parses the raw bytes, skipping the utf-8 decode)."""
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     
     def _load_prereq_graph(self) -> Dict[str, List[str]]:
         """Load prerequisite graph."""
@@ -201,8 +203,10 @@ class TechnicalRecommender:
         postreq_graph: Dict[str, List[str]]
     ) -> pd.DataFrame:
         """Create dataframe for technical courses with metadata."""
-        # Filter to only technical courses
-        df = all_courses_df[all_courses_df['course_code'].isin(technical_courses)].copy()
+        # Filter to only technical courses (all_courses.csv lists some courses
+        # more than once, e.g. per term, so keep one row per code)
+        df = all_courses_df[all_courses_df['course_code'].isin(technical_courses)]
+        df = df.drop_duplicates(subset='course_code').copy()
         
         # Add code column (normalized)
         df['code'] = df['course_code']
@@ -240,11 +244,13 @@ class TechnicalRecommender:
                 'prerequisites': prereq_graph.get(course, [])
             }
             
-            # Use backend's robust prerequisite checking
+            # Use backend's robust prerequisite checking; recommend_courses
+            # normalized both lists before calling us
             can_take, missing = can_take_course(
                 course,
                 completed_or_in_progress,
-                course_data
+                course_data,
+                assume_normalized=True
             )
             
             if can_take:
@@ -311,37 +317,31 @@ class TechnicalRecommender:
         lambda_param: float = 0.7
     ) -> List[int]:
         """Maximal Marginal Relevance for diversity."""
-        selected = []
-        candidates = np.arange(len(scores))
+        n = len(scores)
         
         # Select highest scoring course first
-        first = np.argmax(scores)
-        selected.append(first)
-        candidates = np.delete(candidates, np.where(candidates == first))
-        
-        while len(selected) < topk and len(candidates) > 0:
-            mmr_scores = []
-            for c in candidates:
-                relevance = scores[c]
-                
-                # Calculate similarity to already selected courses
-                if len(selected) > 0:
-                    sims_to_selected = cosine_similarity(
-                        X[c:c+1], X[selected]
-                    ).flatten()
-                    max_sim = np.max(sims_to_selected)
-                else:
-                    max_sim = 0
-                
-                # MMR score: balance relevance and diversity
-                mmr = lambda_param * relevance - (1 - lambda_param) * max_sim
-                mmr_scores.append(mmr)
+        first = int(np.argmax(scores))
+        selected = [first]
+        # Chosen courses are masked out instead of np.delete-ing a candidate array
+        selected_mask = np.zeros(n, dtype=bool)
+        selected_mask[first] = True
+        # Running max similarity of every course to the selected set; each
+        # round only adds the newest pick's similarities
+        max_sim = np.full(n, -np.inf)
+        
+        while len(selected) < min(topk, n):
+            last = selected[-1]
+            new_sims = cosine_similarity(X, X[last:last+1]).ravel()
+            np.maximum(max_sim, new_sims, out=max_sim)
+            
+            # MMR score: balance relevance and diversity
+            mmr_scores = lambda_param * scores - (1 - lambda_param) * max_sim
+            mmr_scores[selected_mask] = -np.inf
             
             # Select best MMR score
-            best_idx = np.argmax(mmr_scores)
-            best_candidate = candidates[best_idx]
+            best_candidate = int(np.argmax(mmr_scores))
             selected.append(best_candidate)
-            candidates = np.delete(candidates, best_idx)
+            selected_mask[best_candidate] = True
         
         return selected
     
@@ -406,7 +406,8 @@ class TechnicalRecommender:
             max_df=0.7,
             min_df=2,
             ngram_range=(1, 2),
-            stop_words='english'
+            stop_words='english',
+            dtype=np.float32,
         )
         X_tfidf = vectorizer.fit_transform(corpus)
         
@@ -443,19 +444,22 @@ class TechnicalRecommender:
                 level_filtered.append(course)
         
         # Filter dataframe to only eligible courses
-        df_eligible = courses_df[courses_df['code'].isin(level_filtered)].copy()
+        eligible_mask = courses_df['code'].isin(level_filtered).to_numpy()
+        df_eligible = courses_df[eligible_mask].copy()
         eligible_indices = df_eligible.index.tolist()
         
         if len(df_eligible) == 0:
             return []
         
-        # Get TF-IDF vectors for eligible courses
-        X_eligible = X_tfidf[eligible_indices]
+        # Get TF-IDF vectors for eligible courses (rows of X_tfidf are positional,
+        # while eligible_indices are labels from all_courses_df)
+        X_eligible = X_tfidf[eligible_mask]
         
         # STEP 2: TF-IDF Interest Scoring
         if interests:
             query_vec = vectorizer.transform([interests])
-            interest_scores = cosine_similarity(query_vec, X_eligible).flatten()
+            # TF-IDF rows are L2-normalized, so a sparse dot product is the cosine similarity
+            interest_scores = (X_eligible @ query_vec.T).toarray().ravel()
         else:
             # If no interests, use uniform scores
             interest_scores = np.ones(len(df_eligible)) * 0.1
@@ -522,12 +526,16 @@ class TechnicalRecommender:
 
 # Singleton instance
 _technical_recommender: Optional[TechnicalRecommender] = None
+_technical_recommender_lock = threading.Lock()
 
 
 def get_technical_recommender() -> TechnicalRecommender:
     """Get singleton technical recommender instance."""
     global _technical_recommender
     if _technical_recommender is None:
-        _technical_recommender = TechnicalRecommender()
+        # Startup warmups run on several threads; only one may build the instance
+        with _technical_recommender_lock:
+            if _technical_recommender is None:
+                _technical_recommender = TechnicalRecommender()
     return _technical_recommender
 
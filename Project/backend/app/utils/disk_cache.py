@@ -0,0 +1,77 @@
+"""On-disk cache for artifacts derived from the data files."""
+import logging
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Callable, Iterable, TypeVar
+
+import numpy
+import pandas
+import scipy
+import sklearn
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Project/backend/.cache (git-ignored)
+CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache"
+
+# Cached artifacts are pickled DataFrames, CSR matrices and fitted vectorizers,
+# which aren't portable across these versions; any change forces a rebuild
+_RUNTIME_KEY = (
+    tuple(sys.version_info[:3]),
+    numpy.__version__,
+    pandas.__version__,
+    scipy.__version__,
+    sklearn.__version__,
+)
+
+
+def _source_key(sources: Iterable[str]) -> tuple:
+    """Identify the exact files and library versions an artifact was built from."""
+    key = []
+    for source in sources:
+        stat = os.stat(source)
+        key.append((os.path.abspath(source), stat.st_mtime_ns, stat.st_size))
+    return (_RUNTIME_KEY, tuple(key))
+
+
+def load_or_build(name: str, sources: Iterable[str], build: Callable[[], T]) -> T:
+    """Return the cached artifact for name, rebuilding it when any source changed.
+
+    Callers should list their own module file among the sources so that code
+    changes to the build step invalidate the cache too. Cache read/write
+    failures are logged and fall back to building in memory.
+    """
+    try:
+        key = _source_key(sources)
+    except OSError:
+        # Missing source: let build() raise or handle it the way it always has
+        return build()
+
+    path = CACHE_DIR / f"{name}.pkl"
+    try:
+        with open(path, "rb") as f:
+            # The key is pickled ahead of the value, so a file written by other
+            # library versions is rejected before its value is unpickled
+            if pickle.load(f) == key:
+                return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Ignoring unreadable cache %s: %s", path, e)
+
+    value = build()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning("Could not write cache %s: %s", path, e)
+    return value
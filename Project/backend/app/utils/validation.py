@@ -1,6 +1,13 @@
 """Input validation utilities."""
 import re
-from typing import List
+import sys
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# Match pattern: 2-4 letters, space, 3 digits, optional letter
+_COURSE_CODE_RE = re.compile(r'^[A-Z]{2,4}\s+\d{3}[A-Z]?$', re.IGNORECASE)
+# Split "DEPT123" / "DEPT 123" into department and number
+_COURSE_CODE_PARTS_RE = re.compile(r'^([A-Z]{2,4})\s*(\d{3}[A-Z]?)$')
 
 
 def validate_course_code(code: str) -> bool:
@@ -8,11 +15,10 @@ def validate_course_code(code: str) -> bool:
     if not code or not isinstance(code, str):
         return False
     
-    # Match pattern: 2-4 letters, space, 3 digits, optional letter
-    pattern = r'^[A-Z]{2,4}\s+\d{3}[A-Z]?$'
-    return bool(re.match(pattern, code.strip(), re.IGNORECASE))
+    return bool(_COURSE_CODE_RE.match(code.strip()))
 
 
+@lru_cache(maxsize=4096)
 def normalize_course_code(code: str) -> str:
     """Normalize course code to standard format."""
     if not code:
@@ -22,24 +28,51 @@ def normalize_course_code(code: str) -> str:
     normalized = code.strip().upper()
     
     # Ensure format is "DEPT 123" not "DEPT123"
-    match = re.match(r'^([A-Z]{2,4})\s*(\d{3}[A-Z]?)$', normalized)
+    match = _COURSE_CODE_PARTS_RE.match(normalized)
     if match:
         return f"{match.group(1)} {match.group(2)}"
     
     return normalized
 
 
-def validate_course_codes(codes: List[str]) -> List[str]:
-    """Validate and normalize list of course codes."""
-    if not isinstance(codes, list):
-        return []
-    
+@lru_cache(maxsize=4096)
+def _normalize_valid_code(code: str) -> Optional[str]:
+    """Return the canonical "DEPT NUM" form of a code, or None if invalid (memoized)."""
+    # One match does both jobs: a code is valid exactly when
+    # normalize_course_code can split it into "DEPT NUM"
+    match = _COURSE_CODE_PARTS_RE.match(code.strip().upper())
+    if match:
+        # Interned so recommender dict/set lookups can short-circuit on identity
+        return sys.intern(f"{match.group(1)} {match.group(2)}")
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _validate_course_codes_cached(codes: Tuple) -> Tuple[str, ...]:
+    """Validate and normalize a tuple of course codes (memoized)."""
     normalized = []
     for code in codes:
         if isinstance(code, str):
-            norm_code = normalize_course_code(code)
-            if norm_code and validate_course_code(norm_code):
-                normalized.append(norm_code)
+            # Per-code cache covers lists that differ from a cached tuple
+            # by only a course or two
+            code = _normalize_valid_code(code)
+            if code:
+                normalized.append(code)
     
-    return normalized
+    return tuple(normalized)
+
 
+def validate_course_codes(codes: List[str]) -> List[str]:
+    """Validate and normalize list of course codes.
+    
+    Results are memoized on the tuple of inputs, so repeated requests with the
+    same course list skip normalization entirely.
+    """
+    if not isinstance(codes, list):
+        return []
+    
+    try:
+        return list(_validate_course_codes_cached(tuple(codes)))
+    except TypeError:
+        # Unhashable entries (e.g. nested lists) are never valid codes
+        return list(_validate_course_codes_cached(tuple(c for c in codes if isinstance(c, str))))
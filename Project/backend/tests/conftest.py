@@ -0,0 +1,67 @@
+"""Shared fixtures for the backend API tests.
+
+The course, major and club data ship with the repo. The GenEd CSV does not, so
+the GenEd recommender is pointed at a small generated one instead.
+"""
+import csv
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.api.routes as routes
+import app.main as main
+import app.services.gened_recommender as gened_module
+from app.services.gened_recommender import GenedRecommender
+
+GENED_ROWS = [
+    ("HIST 100", "American History and Culture", 3.1, "", "US", "", "HUM", "", "", ""),
+    ("HIST 141", "Western Civilization History", 3.3, "", "WCC", "", "HUM", "", "", ""),
+    ("PSYC 100", "Introduction to Psychology", 3.2, "", "", "", "", "", "", "SBS"),
+    ("PSYC 201", "Psychology of Health", 3.5, "", "", "", "", "", "", "SBS"),
+    ("MUS 130", "Music in Society", 3.6, "", "NW", "", "HUM", "", "", ""),
+    ("MUS 133", "Introduction to World Music", 3.4, "", "NW", "", "HUM", "", "", ""),
+    ("ART 140", "Introduction to Art and Design", 3.7, "", "", "", "HUM", "", "", ""),
+    ("ART 155", "Art and Film Culture", 3.5, "", "US", "", "HUM", "", "", ""),
+    ("CHEM 102", "General Chemistry Lab", 2.8, "", "", "", "", "NAT", "", ""),
+    ("CHEM 104", "General Chemistry Science", 2.9, "", "", "", "", "NAT", "", ""),
+    ("ECON 102", "Microeconomic Principles", 3.0, "", "", "", "", "", "", "SBS"),
+    ("ECON 103", "Macroeconomic Principles", 3.0, "", "", "", "", "", "", "SBS"),
+    ("STAT 100", "Statistics and Data", 3.1, "", "", "", "", "", "QR", ""),
+    ("MATH 115", "Math and Statistics Preparation", 2.7, "", "", "", "", "", "QR", ""),
+    ("RHET 105", "Writing and Research", 3.8, "", "", "COMP1", "", "", "", ""),
+    ("ENGL 101", "Writing about Literature", 3.6, "ACP", "", "", "HUM", "", "", ""),
+]
+
+
+@pytest.fixture(scope="session")
+def gened_csv(tmp_path_factory):
+    """Path to a small GenEd catalog in the real CSV's column layout."""
+    path = tmp_path_factory.mktemp("data") / "gened_courses_with_avg_gpa.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["COURSE", "TITLE", "Average_GPA", "ACP", "CS", "COMP1", "HUM", "NAT", "QR", "SBS"])
+        writer.writerows(GENED_ROWS)
+    return path
+
+
+@pytest.fixture
+def gened_recommender(monkeypatch, gened_csv):
+    """Install a GenEd recommender that reads the generated CSV."""
+    recommender = GenedRecommender(data_path=str(gened_csv))
+    monkeypatch.setattr(gened_module, "_gened_recommender", recommender)
+    return recommender
+
+
+@pytest.fixture
+def client(gened_recommender, monkeypatch):
+    """API client; startup warmup is skipped, so services load on first use."""
+    monkeypatch.setattr(main, "_ready", False)
+    # Undo whatever a test's bind_services() call leaves behind
+    for name in ("_data_loader", "_recommender", "_club_recommender", "_technical_recommender"):
+        monkeypatch.setattr(routes, name, None)
+    monkeypatch.setattr(routes, "_gened_recommender", gened_recommender)
+    # Lifespan shutdown closes the pool; give it a throwaway one so the
+    # routes' pool is still usable by later tests
+    monkeypatch.setattr(main, "_RECOMMENDER_POOL", ThreadPoolExecutor(max_workers=1))
+    return TestClient(main.app)
@@ -0,0 +1,26 @@
+"""Tests for ClubRecommender's CSV preparation."""
+import pandas as pd
+import pytest
+
+from app.services.club_recommender import ClubRecommender
+
+TEXT_COLUMNS = ['title', 'mission', 'tags', 'membership_benefits', 'website']
+
+
+@pytest.mark.parametrize("na_text", ["NA", "N/A", "n/a", "None", "null", "NaN", ""])
+def test_na_like_cells_are_blank(tmp_path, na_text):
+    # pandas' NA markers have always come through as blanks; keep it that way
+    default = ClubRecommender()
+    clubs = pd.read_csv(default.clubs_path, encoding='latin-1').head(40)
+    clubs[TEXT_COLUMNS] = clubs[TEXT_COLUMNS].astype(object)
+    clubs.loc[0, TEXT_COLUMNS] = na_text
+    clubs_path = tmp_path / "clubs.csv"
+    clubs.to_csv(clubs_path, index=False)
+
+    recommender = ClubRecommender(clubs_path=str(clubs_path), tags_path=default.tags_path)
+    df = recommender._prepare_clubs()[0]
+
+    assert df.loc[0, TEXT_COLUMNS].tolist() == [''] * len(TEXT_COLUMNS)
+    assert df.loc[0, 'clean_tags'] == ''
+    # Other rows are left as they were
+    assert df.loc[1, 'title'] == clubs.loc[1, 'title']
@@ -0,0 +1,67 @@
+"""Tests for /api/recommend/combined."""
+
+REQUEST = {
+    "completed_courses": ["CS 124", "MATH 221"],
+    "major_name": "Computer Science, BS",
+    "technical_interests": "systems",
+    "club_interests": "music",
+    "gened_interests": "history",
+    "technical_topk": 5,
+    "club_topk": 5,
+    "gened_topk": 5,
+}
+
+
+def test_invalid_course_codes_are_rejected(client):
+    response = client.post(
+        "/api/recommend/combined", json={**REQUEST, "completed_courses": ["not a code"]}
+    )
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["type"] == "course_code_format"
+    assert error["loc"] == ["body", "completed_courses"]
+
+
+def test_empty_course_list_is_rejected(client):
+    response = client.post("/api/recommend/combined", json={**REQUEST, "completed_courses": []})
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["type"] == "courses_required"
+
+
+def test_course_codes_are_normalized(client):
+    response = client.post(
+        "/api/recommend/combined", json={**REQUEST, "completed_courses": ["cs124", "MATH 221"]}
+    )
+
+    assert response.status_code == 200
+    assert {"technical_courses", "gened", "clubs"} <= set(response.json())
+
+
+def test_sections_without_input_are_skipped(client, monkeypatch):
+    import app.api.routes as routes
+
+    calls = []
+    monkeypatch.setattr(
+        routes._gened_recommender, "recommend_courses", lambda **kwargs: calls.append(kwargs) or []
+    )
+    response = client.post(
+        "/api/recommend/combined",
+        json={"completed_courses": ["CS 124"], "gened_min_gpa": 3.5},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"gened": [], "clubs": []}
+    assert calls == []
+
+
+def test_gened_runs_with_only_preferences(client):
+    response = client.post(
+        "/api/recommend/combined",
+        json={"completed_courses": ["CS 124"], "gened_preferences": ["HUM"], "gened_topk": 3},
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["gened"]) == 3
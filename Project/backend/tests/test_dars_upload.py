@@ -0,0 +1,45 @@
+"""Tests for the /api/dars/upload endpoint."""
+import shutil
+
+import app.api.routes as routes
+
+PDF_BYTES = b"%PDF-1.4 fake dars report"
+
+
+def test_upload_is_parsed_in_place(client, monkeypatch):
+    seen = {}
+
+    def fake_parse(fp):
+        seen["data"] = fp.read()
+        return ["CS 124", "MATH 221"]
+
+    def no_copy(*args, **kwargs):
+        raise AssertionError("upload should be parsed without copying it")
+
+    monkeypatch.setattr(routes, "parse_courses_stream", fake_parse)
+    monkeypatch.setattr(shutil, "copyfileobj", no_copy)
+
+    response = client.post(
+        "/api/dars/upload", files={"file": ("dars.pdf", PDF_BYTES, "application/pdf")}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"courses": ["CS 124", "MATH 221"], "count": 2}
+    # The parser starts from the beginning of the upload
+    assert seen["data"] == PDF_BYTES
+
+
+def test_empty_upload_is_rejected(client):
+    response = client.post(
+        "/api/dars/upload", files={"file": ("dars.pdf", b"", "application/pdf")}
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Uploaded file is empty"}
+
+
+def test_non_pdf_is_rejected(client):
+    response = client.post(
+        "/api/dars/upload", files={"file": ("dars.txt", PDF_BYTES, "text/plain")}
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "File must be a PDF"}
@@ -0,0 +1,56 @@
+"""Tests for the on-disk artifact cache."""
+import pytest
+
+from app.utils import disk_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    return str(path)
+
+
+def _builder(calls):
+    def build():
+        calls.append(1)
+        return {"built": len(calls)}
+    return build
+
+
+def test_reuses_artifact_while_sources_are_unchanged(cache_dir, source):
+    calls = []
+    assert disk_cache.load_or_build("thing", (source,), _builder(calls)) == {"built": 1}
+    assert disk_cache.load_or_build("thing", (source,), _builder(calls)) == {"built": 1}
+    assert len(calls) == 1
+
+
+def test_rebuilds_when_a_source_changes(cache_dir, source):
+    calls = []
+    disk_cache.load_or_build("thing", (source,), _builder(calls))
+    with open(source, "a") as f:
+        f.write("3,4\n")
+
+    assert disk_cache.load_or_build("thing", (source,), _builder(calls)) == {"built": 2}
+
+
+def test_rebuilds_when_library_versions_change(cache_dir, source, monkeypatch):
+    calls = []
+    disk_cache.load_or_build("thing", (source,), _builder(calls))
+    monkeypatch.setattr(disk_cache, "_RUNTIME_KEY", ("other", "versions"))
+
+    assert disk_cache.load_or_build("thing", (source,), _builder(calls)) == {"built": 2}
+
+
+def test_unreadable_cache_file_is_rebuilt(cache_dir, source):
+    cache_dir.mkdir()
+    (cache_dir / "thing.pkl").write_bytes(b"not a pickle")
+
+    calls = []
+    assert disk_cache.load_or_build("thing", (source,), _builder(calls)) == {"built": 1}
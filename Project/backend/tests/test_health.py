@@ -0,0 +1,50 @@
+"""Tests for /health readiness reporting."""
+import asyncio
+
+import pytest
+
+import app.main as main
+import app.services.gened_recommender as gened_module
+from app.services.gened_recommender import GenedRecommender
+
+
+def test_not_ready_before_warmup(client):
+    response = client.get("/health")
+    assert response.status_code == 503
+    assert response.json() == {"status": "unavailable", "ready": False}
+
+
+def test_ready_after_successful_warmup(client):
+    asyncio.run(main._preload_singletons())
+
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy", "ready": True}
+
+
+def test_not_ready_when_a_warmup_fails(client, monkeypatch, tmp_path):
+    missing = GenedRecommender(data_path=str(tmp_path / "missing.csv"))
+    monkeypatch.setattr(gened_module, "_gened_recommender", missing)
+
+    asyncio.run(main._preload_singletons())
+
+    health = client.get("/health")
+    assert health.status_code == 503
+    assert health.json() == {"status": "unavailable", "ready": False}
+    response = client.post("/api/gened/recommend", json={"interests": "history"})
+    assert response.status_code == 500
+
+
+def test_lifespan_warms_up_before_serving(client):
+    with client:
+        # The lifespan has finished warming up by the time any request is served
+        response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+
+
+def test_lifespan_shuts_down_recommender_pool(client):
+    with client:
+        pass
+    with pytest.raises(RuntimeError):
+        main._RECOMMENDER_POOL.submit(lambda: None)
@@ -0,0 +1,20 @@
+"""Tests for how the API router is registered."""
+from collections import Counter
+
+import app.main as main
+from app.api.routes import router
+
+
+def test_routes_are_registered_once():
+    keys = Counter((route.path, frozenset(route.methods)) for route in router.routes)
+    assert [key for key, count in keys.items() if count > 1] == []
+
+
+def test_router_is_mounted_once():
+    api_routes = [
+        (route.path, frozenset(route.methods))
+        for route in main.app.routes
+        if route.path.startswith("/api/")
+    ]
+    assert len(api_routes) == len(router.routes)
+    assert len(set(api_routes)) == len(api_routes)
@@ -0,0 +1,38 @@
+"""Regression tests for /api/technical/recommend."""
+
+REQUEST = {
+    "major_name": "Computer Science, BS",
+    "completed_courses": ["CS 124", "MATH 221", "CS 128", "CS 173"],
+    "interests": "machine learning",
+    "topk": 8,
+}
+
+
+def test_recommend_succeeds(client):
+    # Used to 500: TF-IDF rows (positional) were indexed with DataFrame labels
+    response = client.post("/api/technical/recommend", json=REQUEST)
+
+    assert response.status_code == 200
+    recommendations = response.json()["recommendations"]
+    assert recommendations
+    assert len(recommendations) <= REQUEST["topk"]
+
+
+def test_recommend_lists_each_course_once(client):
+    # all_courses.csv repeats some course codes; each may only be recommended once
+    response = client.post("/api/technical/recommend", json=REQUEST)
+
+    codes = [rec["course_code"] for rec in response.json()["recommendations"]]
+    assert len(codes) == len(set(codes))
+
+
+def test_recommend_without_interests(client):
+    response = client.post("/api/technical/recommend", json={**REQUEST, "interests": ""})
+
+    assert response.status_code == 200
+
+
+def test_unknown_major_is_404(client):
+    response = client.post("/api/technical/recommend", json={**REQUEST, "major_name": "Nope"})
+
+    assert response.status_code == 404
@@ -0,0 +1,33 @@
+"""Typo correction must keep fuzzywuzzy's accept rule: round(WRatio) > 70."""
+import pytest
+from rapidfuzz import fuzz, utils
+
+from app.services.club_recommender import ClubRecommender
+from app.services.gened_recommender import GenedRecommender
+
+VOCAB = ["history", "literature"]
+
+CASES = [
+    # WRatio 70.59 rounds to 71, so fuzzywuzzy accepted it
+    pytest.param("aahemistry", "history", id="rounds-up-to-71"),
+    # WRatio 70.0 never passed
+    pytest.param("aaitecture", "aaitecture", id="exactly-70"),
+    pytest.param("history", "history", id="exact-match"),
+]
+
+
+def test_case_scores_straddle_the_threshold():
+    assert 70.5 < fuzz.WRatio("aahemistry", "history", processor=utils.default_process) < 71
+    assert fuzz.WRatio("aaitecture", "literature", processor=utils.default_process) == 70
+
+
+@pytest.mark.parametrize("word, expected", CASES)
+def test_club_typo_fix(word, expected):
+    assert ClubRecommender()._fix_typo(word, VOCAB) == [expected]
+
+
+@pytest.mark.parametrize("word, expected", CASES)
+def test_gened_typo_fix(word, expected):
+    recommender = GenedRecommender()
+    recommender._vocab = VOCAB
+    assert recommender._fix_typo(word, None) == [expected]
@@ -0,0 +1,115 @@
+"""422 bodies from the JSON routes must match FastAPI's native body validation.
+
+Every JSON route declares its request model as a plain body parameter, so
+FastAPI owns parsing and error shaping. These tests fail if a route stops doing
+so and its error bodies drift from what a native route returns.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from app.api.routes import (
+    ClubRecommendationRequest,
+    CombinedRecommendationRequest,
+    GenedRecommendationRequest,
+    RecommendationRequest,
+    TechnicalRecommendationRequest,
+    router,
+)
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+ROUTES = {
+    "/api/recommend": RecommendationRequest,
+    "/api/clubs/recommend": ClubRecommendationRequest,
+    "/api/gened/recommend": GenedRecommendationRequest,
+    "/api/recommend/combined": CombinedRecommendationRequest,
+    "/api/technical/recommend": TechnicalRecommendationRequest,
+}
+
+# Bodies that fail validation for every route above
+INVALID_BODIES = [
+    pytest.param(b'{"topk": 500, "num_recommendations": 500}', id="invalid-field"),
+    pytest.param(b'{"interests": "music", bad', id="malformed-json"),
+    pytest.param(b'{"topk": 5} trailing', id="trailing-data"),
+    pytest.param(b"", id="empty-body"),
+    pytest.param(b"null", id="null"),
+    pytest.param(b"[1, 2]", id="array"),
+    pytest.param(b'"text"', id="string"),
+    pytest.param(b'{"topk": "five", "num_recommendations": "five", "min_gpa": "high"}', id="wrong-types"),
+    pytest.param(b'{"completed_courses": [], "preferred_tags": "x", "gened_preferences": 1}', id="bad-lists"),
+    pytest.param(b'{"completed_courses": ["not a course"], "technical_topk": 0, "topk": 0}', id="bad-course-codes"),
+]
+
+# Content types FastAPI does and doesn't decode as JSON
+CONTENT_TYPES = [
+    pytest.param("application/json", id="json"),
+    pytest.param("application/vnd.api+json; charset=utf-8", id="json-suffix"),
+    pytest.param(None, id="no-content-type"),
+    pytest.param("text/plain", id="text-plain"),
+]
+
+VALID_COMBINED_BODY = b'{"completed_courses": ["CS 124"], "club_topk": 1, "gened_topk": 1}'
+
+
+def _native_client() -> TestClient:
+    """App whose routes declare the same models as plain FastAPI body params."""
+    native = FastAPI()
+    for path, model in ROUTES.items():
+
+        def endpoint(request: model):  # noqa: F821 - annotation is the loop's model
+            return {}
+
+        native.post(path)(endpoint)
+    return TestClient(native)
+
+
+@pytest.fixture(scope="module")
+def native_client():
+    return _native_client()
+
+
+def test_json_routes_use_native_body_parsing():
+    body_models = {
+        "/api" + route.path: route.body_field.type_
+        for route in router.routes
+        if isinstance(route, APIRoute) and route.body_field is not None
+    }
+    for path, model in ROUTES.items():
+        assert body_models.get(path) is model, path
+
+
+@pytest.mark.parametrize("path", ROUTES)
+@pytest.mark.parametrize("body", INVALID_BODIES)
+def test_error_body_matches_native(client, native_client, path, body):
+    expected = native_client.post(path, content=body, headers=JSON_HEADERS)
+    actual = client.post(path, content=body, headers=JSON_HEADERS)
+
+    assert expected.status_code == 422
+    assert actual.status_code == expected.status_code
+    assert actual.json() == expected.json()
+
+
+@pytest.mark.parametrize("content_type", CONTENT_TYPES)
+def test_content_type_handling_matches_native(client, native_client, content_type):
+    headers = {"content-type": content_type} if content_type else {}
+    path = "/api/recommend/combined"
+    expected = native_client.post(path, content=VALID_COMBINED_BODY, headers=headers)
+    actual = client.post(path, content=VALID_COMBINED_BODY, headers=headers)
+
+    assert actual.status_code == expected.status_code
+    if expected.status_code == 422:
+        assert actual.json() == expected.json()
+
+
+def test_malformed_json_reports_decode_error(client):
+    response = client.post(
+        "/api/gened/recommend", content=b'{"interests": "music", bad', headers=JSON_HEADERS
+    )
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body", 23]
+    assert error["msg"] == "JSON decode error"
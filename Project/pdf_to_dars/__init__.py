@@ -0,0 +1,5 @@
+"""DARS PDF parsing."""
+
+from .pdf_to_dars import parse_courses, parse_courses_stream
+
+__all__ = ["parse_courses", "parse_courses_stream"]
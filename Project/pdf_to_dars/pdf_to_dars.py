@@ -1,6 +1,6 @@
 from pathlib import Path
 import re
-from typing import List
+from typing import BinaryIO, List
 
 from pypdf import PdfReader
 
@@ -12,7 +12,15 @@ COURSE_NUMBER = re.compile(r"^\d{3}$")
 
 def parse_courses(pdf_path: str | Path) -> List[str]:
     """Return list of courses like 'CS 124' from a DARS PDF."""
-    reader = PdfReader(str(pdf_path))
+    return _parse_reader(PdfReader(str(pdf_path)))
+
+
+def parse_courses_stream(fp: BinaryIO) -> List[str]:
+    """Same as parse_courses, but reads the PDF from a seekable binary file object."""
+    return _parse_reader(PdfReader(fp))
+
+
+def _parse_reader(reader: PdfReader) -> List[str]:
     text = "\n".join(page.extract_text() or "" for page in reader.pages)
 
     marker = "SUMMARY OF COURSES TAKEN"